@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 import argparse
+import codecs
+import functools
+import itertools
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 import csv
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib json module is the fallback
+    orjson = None
+
 DEFAULT_TERM_BASES = {
     "efo": "http://www.ebi.ac.uk/efo/",
     "ncbitaxon": "http://purl.obolibrary.org/obo/",
@@ -17,55 +25,150 @@ DEFAULT_TERM_BASES = {
     "go": "http://purl.obolibrary.org/obo/",
 }
 
-DEFAULT_OLS_SOURCES = set(DEFAULT_TERM_BASES.keys())
+# Keys of DEFAULT_TERM_BASES are lowercase, so callers look them up with
+# an already-lowercased source name.
+DEFAULT_OLS_SOURCES = frozenset(DEFAULT_TERM_BASES)
 IDR_PROFILE_ID = "https://idr.openmicroscopy.org/ro-crate/profile/0.1"
 IDR_PROFILE_NAME = "IDR study metadata RO-Crate profile"
 IDR_PROFILE_VERSION = "0.1.0"
 
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_NCBITAXON_RE = re.compile(r"(?:NCBITaxon[_:]?)(\d+)", re.IGNORECASE)
+_PREFIX_ACC_RE = re.compile(r"^([A-Za-z]+)[_:](\d+)$")
+_TB_RE = re.compile(r"Total\s+Tb:\s*([0-9.]+)", re.IGNORECASE)
+_IMG_RE = re.compile(r"5D\s+Images:\s*(\d+)", re.IGNORECASE)
+_IDR_ACCESSION_RE = re.compile(r"(idr\d+)", re.IGNORECASE)
+_RENDER_THUMBNAIL_RE = re.compile(r"/webgateway/render_thumbnail/(\d+)/?")
+_IMG_DETAIL_RE = re.compile(r"/webclient/img_detail/(\d+)/?")
+_SHOW_IMAGE_RE = re.compile(r"image-(\d+)")
+
+_HTTP_PREFIXES = ("http://", "https://")
+_KNOWN_SCHEME_PREFIXES = _HTTP_PREFIXES + ("ftp://", "file://")
+_URL_PREFIXES = ("http://", "https://", "www.")
+_NCBITAXON_PREFIX = "http://purl.obolibrary.org/obo/NCBITaxon_"
+_UTF8_CODECS = ("utf-8", "utf-8-sig")
+
 
 @dataclass
 class IDRRow:
+    # Values are stored stripped (see clean_value and rows_from_property_values),
+    # so lookups can test them for truthiness without stripping again.
     key: str
     values: List[str]
     line_no: int
     section: Optional[str] = None
 
     def has_value(self) -> bool:
-        return any(v.strip() for v in self.values)
+        return any(self.values)
+
+
+class RowIndex:
+    """Rows grouped by key, for repeated lookups over a fixed block of rows."""
+
+    def __init__(self, rows: Iterable[IDRRow]) -> None:
+        self._by_key: Dict[str, List[IDRRow]] = {}
+        for row in rows:
+            self._by_key.setdefault(row.key, []).append(row)
+
+    def rows_for_key(self, key: str) -> List[IDRRow]:
+        return list(self._by_key.get(key, ()))
+
+    def first_value(self, key: str) -> Optional[str]:
+        for row in self._by_key.get(key, ()):
+            for value in row.values:
+                if value:
+                    return value
+        return None
+
+    def values_for_key(self, key: str) -> List[str]:
+        rows = self._by_key.get(key)
+        return rows[0].values if rows else []
 
 
 @dataclass
 class IDRMetadata:
+    """Parsed IDR metadata rows.
+
+    The key index and the study split are built from rows once and cached,
+    so rows must not be changed after construction; build a new IDRMetadata
+    instead.
+    """
+
     raw_text: str
     rows: List[IDRRow]
+    _index: RowIndex = field(init=False, repr=False, compare=False)
+    _study_end: Optional[int] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self) -> None:
+        self._index = RowIndex(self.rows)
 
     def rows_for_key(self, key: str) -> List[IDRRow]:
-        return [row for row in self.rows if row.key == key]
+        return self._index.rows_for_key(key)
 
     def first_value(
         self, key: str, rows: Optional[List[IDRRow]] = None
     ) -> Optional[str]:
-        for row in rows or self.rows:
+        if not rows or rows is self.rows:
+            return self._index.first_value(key)
+        for row in rows:
             if row.key != key:
                 continue
             for value in row.values:
-                if value.strip():
-                    return value.strip()
+                if value:
+                    return value
         return None
 
     def values_for_key(
         self, key: str, rows: Optional[List[IDRRow]] = None
     ) -> List[str]:
-        for row in rows or self.rows:
+        if not rows or rows is self.rows:
+            return self._index.values_for_key(key)
+        for row in rows:
             if row.key == key:
                 return row.values
         return []
 
     def split_study_rows(self) -> Tuple[List[IDRRow], List[IDRRow]]:
-        for idx, row in enumerate(self.rows):
-            if row.key in ("Screen Number", "Experiment Number") and row.has_value():
-                return self.rows[:idx], self.rows[idx:]
-        return self.rows, []
+        if self._study_end is None:
+            self._study_end = len(self.rows)
+            for idx, row in enumerate(self.rows):
+                if (
+                    row.key in ("Screen Number", "Experiment Number")
+                    and row.has_value()
+                ):
+                    self._study_end = idx
+                    break
+        if self._study_end == len(self.rows):
+            return self.rows, []
+        return self.rows[: self._study_end], self.rows[self._study_end :]
+
+    def partition(
+        self,
+    ) -> Tuple[List[IDRRow], List[List[IDRRow]], List[List[IDRRow]]]:
+        """Split rows into study rows, screen blocks and experiment blocks.
+
+        Equivalent to split_study_rows() plus find_blocks() for screens and
+        experiments, but walks the rows once.
+        """
+        study_rows: List[IDRRow] = []
+        screens: List[List[IDRRow]] = []
+        experiments: List[List[IDRRow]] = []
+        current: Optional[List[IDRRow]] = None
+        for row in self.rows:
+            if row.key == "Screen Number" and row.has_value():
+                current = []
+                screens.append(current)
+            elif row.key == "Experiment Number" and row.has_value():
+                current = []
+                experiments.append(current)
+            if current is None:
+                study_rows.append(row)
+            else:
+                current.append(row)
+        return study_rows, screens, experiments
 
     def term_source_map(self) -> Dict[str, str]:
         names = self.values_for_key("Term Source Name")
@@ -106,7 +209,12 @@ class IDRDecoder:
         return IDRMetadata(raw_text=raw_text, rows=rows)
 
     def _decode_bytes(self, raw_bytes: bytes) -> str:
+        skip_utf8 = not _utf8_prefix_ok(raw_bytes)
         for encoding in self.fallback_encodings:
+            if skip_utf8 and codecs.lookup(encoding).name in _UTF8_CODECS:
+                # The sniffed prefix is already invalid UTF-8, so a full
+                # decode would only fail later.
+                continue
             try:
                 return raw_bytes.decode(encoding)
             except UnicodeDecodeError:
@@ -115,25 +223,34 @@ class IDRDecoder:
 
     def _parse_text(self, raw_text: str) -> List[IDRRow]:
         rows: List[IDRRow] = []
+        rows_append = rows.append
         current_section: Optional[str] = None
-        for line_no, raw_line in enumerate(raw_text.splitlines(), start=1):
-            line = raw_line.rstrip("\n")
+        # splitlines() has already removed the line terminators.
+        for line_no, line in enumerate(raw_text.splitlines(), start=1):
             stripped = line.strip()
             if not stripped:
                 continue
-            if stripped.startswith("#"):
-                current_section = stripped.lstrip("#").strip() or None
+            if stripped[0] == "#":
+                # stripped has no trailing whitespace, so only the gap after
+                # the leading hashes needs removing.
+                current_section = stripped.lstrip("#").lstrip() or None
                 continue
             if "\t" in line:
-                parts = line.split("\t")
+                # IDR templates pad rows with trailing tabs; drop them before
+                # splitting so empty cells are never materialized.
+                parts = line.rstrip().split("\t")
             else:
-                parts = re.split(r"\s{2,}", line)
+                parts = _split_on_double_space(line)
             key = parts[0].strip()
-            values = [clean_value(part) for part in parts[1:]]
+            # Inlined clean_value: strip every cell in C via map(), then blank
+            # comment cells, avoiding a Python-level call per cell.
+            values = [
+                "" if value[:1] == "#" else value for value in map(str.strip, parts[1:])
+            ]
             values = trim_trailing_empty(values)
             if not values:
                 continue
-            rows.append(
+            rows_append(
                 IDRRow(key=key, values=values, line_no=line_no, section=current_section)
             )
         return rows
@@ -151,30 +268,64 @@ class IDREncoder:
             if not row.key:
                 continue
             if row.values:
-                line = f"{row.key}\t" + "\t".join(row.values)
+                lines.append("\t".join((row.key, *row.values)))
             else:
-                line = row.key
-            lines.append(line)
-        if not lines:
-            return ""
-        return "\n".join(lines) + "\n"
+                lines.append(row.key)
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def encode_bytes(self, metadata: IDRMetadata, encoding: str = "utf-8") -> bytes:
+        """Like encode(), but returns the text already encoded.
+
+        Rows are encoded straight into one buffer, skipping the list of
+        lines and the joined copy that encode_rows() builds.
+        """
+        if metadata.raw_text:
+            return metadata.raw_text.encode(encoding)
+        # An incremental encoder emits any BOM (UTF-16 etc.) once, up front.
+        encode = codecs.getincrementalencoder(encoding)().encode
+        buf = bytearray(encode(""))
+        tab = encode("\t")
+        newline = encode("\n")
+        for row in metadata.rows:
+            if not row.key:
+                continue
+            buf += encode(row.key)
+            if row.values:
+                buf += tab
+                buf += encode("\t".join(row.values))
+            buf += newline
+        return bytes(buf)
 
 
 class GraphBuilder:
     def __init__(self) -> None:
-        self._entities: Dict[str, dict] = {}
-        self._order: List[str] = []
+        # One entry per @id, in first-add order. Most entities are added once
+        # and stored as-is; repeated adds keep a list of fragments that
+        # to_list() merges once.
+        self._entities: Dict[str, Union[dict, List[dict]]] = {}
 
     def add(self, entity: dict) -> None:
+        entities = self._entities
         entity_id = entity["@id"]
-        if entity_id in self._entities:
-            self._entities[entity_id].update(entity)
-            return
-        self._entities[entity_id] = entity
-        self._order.append(entity_id)
+        existing = entities.get(entity_id)
+        if existing is None:
+            entities[entity_id] = entity
+        elif type(existing) is list:
+            existing.append(entity)
+        else:
+            entities[entity_id] = [existing, entity]
 
     def to_list(self) -> List[dict]:
-        return [self._entities[entity_id] for entity_id in self._order]
+        entities = []
+        for entry in self._entities.values():
+            if type(entry) is not list:
+                entities.append(entry)
+                continue
+            merged: dict = {}
+            for fragment in entry:
+                merged.update(fragment)
+            entities.append(merged)
+        return entities
 
 
 class ROCrateEncoder:
@@ -183,8 +334,14 @@ class ROCrateEncoder:
     def __init__(self) -> None:
         self.thumbnail_map = self._load_thumbnail_map(Path("idr_study_thumbnails.tsv"))
 
-    def _load_gide_context(self) -> dict:
-        """Load the GIDE context from the JSON-LD file."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_gide_context() -> dict:
+        """Load the GIDE context from the JSON-LD file.
+
+        The file is read once per process; every crate shares the returned
+        dict, so it must be treated as read-only.
+        """
         context_path = Path(__file__).resolve().parent / "gide-search-context.jsonld"
         data = json.loads(context_path.read_text(encoding="utf-8"))
         if isinstance(data, dict) and "@context" in data:
@@ -199,10 +356,14 @@ class ROCrateEncoder:
             gide_context,
         ]
 
-        study_rows, _ = metadata.split_study_rows()
+        study_rows, screen_blocks, experiment_blocks = metadata.partition()
+        # Index the study block once. The root-level lookups below fall back
+        # to all rows when the block is empty; the study helpers do not.
+        study_index = RowIndex(study_rows)
+        study = study_index if study_rows else metadata
         term_sources = metadata.term_source_map()
-        accession = metadata.first_value("Comment[IDR Study Accession]", study_rows)
-        study_external_url = metadata.first_value("Study External URL", study_rows)
+        accession = study.first_value("Comment[IDR Study Accession]")
+        study_external_url = study.first_value("Study External URL")
         root_id = build_root_id(accession, study_external_url)
         descriptor_id = build_metadata_descriptor_id(accession)
 
@@ -231,21 +392,19 @@ class ROCrateEncoder:
         )
 
         # Parse authors
-        people = parse_people(study_rows)
+        people = parse_people(study_index)
         for person in people:
             graph.add(person)
 
         # Publication entity
-        publication = self._build_publication_gide(study_rows)
+        publication = self._build_publication_gide(study_index)
         if publication:
             graph.add(publication)
 
         # Taxon entities from Study Organism
-        taxon_refs = []
-        organism_values = metadata.values_for_key("Study Organism", study_rows)
-        organism_accessions = metadata.values_for_key(
-            "Study Organism Term Accession", study_rows
-        )
+        taxon_ids: List[str] = []
+        organism_values = study.values_for_key("Study Organism")
+        organism_accessions = study.values_for_key("Study Organism Term Accession")
         for idx, org_name in enumerate(organism_values):
             if not org_name.strip():
                 continue
@@ -259,143 +418,55 @@ class ROCrateEncoder:
                 "scientificName": org_name.strip(),
             }
             graph.add(taxon_entity)
-            taxon_refs.append({"@id": taxon_id})
-
-        # Process screens and experiments
-        screen_blocks = find_blocks(
-            metadata.rows, "Screen Number", stop_keys=["Experiment Number"]
-        )
-        experiment_blocks = find_blocks(
-            metadata.rows, "Experiment Number", stop_keys=["Screen Number"]
-        )
-
-        # Build BioSamples
-        biosample_refs = []
-        all_protocol_refs = []
-        all_imaging_refs = []
-        all_imaging_protocol_refs = []
-
-        for idx, block in enumerate(screen_blocks, start=1):
-            sample_type = first_value_in_block(block, "Screen Sample Type") or "cell"
-            description = first_value_in_block(block, "Screen Description") or ""
-            biosample_id = f"#screen-biosample-{idx}"
-            biosample = {
-                "@id": biosample_id,
-                "@type": "BioSample",
-                "name": sample_type,
-                "description": description,
-            }
-            if taxon_refs:
-                biosample["taxonomicRange"] = taxon_refs
-            graph.add(biosample)
-            biosample_refs.append({"@id": biosample_id})
-
-            # Imaging method
-            imaging_method = first_value_in_block(block, "Screen Imaging Method")
-            imaging_accession = first_value_in_block(
-                block, "Screen Imaging Method Term Accession"
+            taxon_ids.append(taxon_id)
+        # Shared by every BioSample's taxonomicRange
+        taxon_refs = [{"@id": taxon_id} for taxon_id in taxon_ids]
+
+        # Build BioSamples. Refs are collected as plain @id strings and only
+        # wrapped as {"@id": ...} when the root entity is assembled.
+        biosample_ids: List[str] = []
+        all_protocol_ids: List[str] = []
+        all_imaging_ids: List[str] = []
+        all_imaging_protocol_ids: List[str] = []
+
+        for kind, blocks, default_sample_type in (
+            ("screen", screen_blocks, "cell"),
+            ("experiment", experiment_blocks, "tissue"),
+        ):
+            self._process_blocks(
+                blocks,
+                kind,
+                default_sample_type,
+                taxon_refs,
+                term_sources,
+                graph,
+                biosample_ids,
+                all_imaging_protocol_ids,
+                all_protocol_ids,
+                all_imaging_ids,
             )
-            if imaging_method or imaging_accession:
-                imaging_id = self._build_term_id_simple(imaging_accession, term_sources)
-                imaging_entity = {
-                    "@id": imaging_id,
-                    "@type": "DefinedTerm",
-                    "name": imaging_method or imaging_accession,
-                }
-                graph.add(imaging_entity)
-                all_imaging_refs.append({"@id": imaging_id})
-
-                # Create an imaging protocol (protocol-0) that links to the FBbi term
-                imaging_protocol_id = f"#screen-protocol-{idx}-0"
-                imaging_protocol = {
-                    "@id": imaging_protocol_id,
-                    "@type": "LabProtocol",
-                    "name": imaging_method or imaging_accession,
-                    "measurementTechnique": [{"@id": imaging_id}],
-                }
-                if description:
-                    imaging_protocol["description"] = description
-                graph.add(imaging_protocol)
-                all_imaging_protocol_refs.append({"@id": imaging_protocol_id})
-
-                # Build LabProtocols for this screen
-                protocol_refs = self._build_lab_protocols(
-                    block, idx, imaging_id, graph, "screen", term_sources
-                )
-                all_protocol_refs.extend(protocol_refs)
-
-        for idx, block in enumerate(experiment_blocks, start=1):
-            sample_type = (
-                first_value_in_block(block, "Experiment Sample Type") or "tissue"
-            )
-            description = first_value_in_block(block, "Experiment Description") or ""
-            biosample_id = f"#experiment-biosample-{idx}"
-            biosample = {
-                "@id": biosample_id,
-                "@type": "BioSample",
-                "name": sample_type,
-                "description": description,
-            }
-            if taxon_refs:
-                biosample["taxonomicRange"] = taxon_refs
-            graph.add(biosample)
-            biosample_refs.append({"@id": biosample_id})
-
-            # Imaging method
-            imaging_method = first_value_in_block(block, "Experiment Imaging Method")
-            imaging_accession = first_value_in_block(
-                block, "Experiment Imaging Method Term Accession"
-            )
-            if imaging_method or imaging_accession:
-                imaging_id = self._build_term_id_simple(imaging_accession, term_sources)
-                imaging_entity = {
-                    "@id": imaging_id,
-                    "@type": "DefinedTerm",
-                    "name": imaging_method or imaging_accession,
-                }
-                graph.add(imaging_entity)
-                all_imaging_refs.append({"@id": imaging_id})
-
-                # Create an imaging protocol (protocol-0) that links to the FBbi term
-                imaging_protocol_id = f"#experiment-protocol-{idx}-0"
-                imaging_protocol = {
-                    "@id": imaging_protocol_id,
-                    "@type": "LabProtocol",
-                    "name": imaging_method or imaging_accession,
-                    "measurementTechnique": [{"@id": imaging_id}],
-                }
-                if description:
-                    imaging_protocol["description"] = description
-                graph.add(imaging_protocol)
-                all_imaging_protocol_refs.append({"@id": imaging_protocol_id})
-
-                # Build LabProtocols for this experiment
-                protocol_refs = self._build_lab_protocols(
-                    block, idx, imaging_id, graph, "experiment", term_sources
-                )
-                all_protocol_refs.extend(protocol_refs)
 
         # Dataset size
-        size_refs = self._build_dataset_size(screen_blocks, experiment_blocks, graph)
+        size_ids = self._build_dataset_size(screen_blocks, experiment_blocks, graph)
 
         # Root Dataset entity
         root = {"@id": root_id, "@type": "Dataset"}
 
         # name
-        title = metadata.first_value("Study Title", study_rows)
+        title = study.first_value("Study Title")
         root["name"] = title or accession or root_id
 
         # description
-        description = metadata.first_value("Study Description", study_rows)
+        description = study.first_value("Study Description")
         root["description"] = description or title or root_id
 
         # datePublished
-        pub_date = metadata.first_value("Study Public Release Date", study_rows)
+        pub_date = study.first_value("Study Public Release Date")
         if pub_date:
             root["datePublished"] = pub_date
 
         # license
-        license_url = metadata.first_value("Study License URL", study_rows)
+        license_url = study.first_value("Study License URL")
         if license_url:
             root["license"] = normalize_url(license_url)
 
@@ -418,7 +489,7 @@ class ROCrateEncoder:
             license_id = license_map[license_url]
 
             # schema:copyrightHolder
-            copyright_holder = metadata.first_value("Study Copyright", study_rows)
+            copyright_holder = study.first_value("Study Copyright")
             pub_year = pub_date.split("-")[0]
             if copyright_holder:
                 root["copyrightNotice"] = (
@@ -441,17 +512,15 @@ class ROCrateEncoder:
             root["seeAlso"] = [{"@id": publication["@id"]}]
 
         # about (BioSamples and Taxa)
-        about_refs = biosample_refs + taxon_refs
-        if about_refs:
-            root["about"] = about_refs
+        if biosample_ids or taxon_ids:
+            root["about"] = [{"@id": ref_id} for ref_id in biosample_ids] + taxon_refs
 
         # measurementMethod (imaging protocols first, then other protocols, then imaging methods)
-        measurement_refs = (
-            all_imaging_protocol_refs + all_protocol_refs + all_imaging_refs
+        measurement_ids = dict.fromkeys(
+            itertools.chain(all_imaging_protocol_ids, all_protocol_ids, all_imaging_ids)
         )
-        measurement_refs = self._dedupe_refs(measurement_refs)
-        if measurement_refs:
-            root["measurementMethod"] = measurement_refs
+        if measurement_ids:
+            root["measurementMethod"] = [{"@id": ref_id} for ref_id in measurement_ids]
 
         # thumbnailUrl - collect embeddable thumbnail links
         thumbnails = []
@@ -477,16 +546,93 @@ class ROCrateEncoder:
             root["thumbnailUrl"] = thumbnails
 
         # size
-        if size_refs:
-            root["size"] = size_refs
+        if size_ids:
+            root["size"] = [{"@id": ref_id} for ref_id in size_ids]
 
         graph.add(root)
         return {"@context": context, "@graph": graph.to_list()}
 
-    def _build_publication_gide(self, study_rows: List[IDRRow]) -> Optional[dict]:
+    def _process_blocks(
+        self,
+        blocks: List[List[IDRRow]],
+        kind: str,
+        default_sample_type: str,
+        taxon_refs: List[dict],
+        term_sources: Dict[str, str],
+        graph: GraphBuilder,
+        biosample_ids: List[str],
+        imaging_protocol_ids: List[str],
+        protocol_ids: List[str],
+        imaging_ids: List[str],
+    ) -> None:
+        """Build BioSample, imaging and LabProtocol entities for a set of blocks."""
+        label = kind.capitalize()
+        sample_type_key = f"{label} Sample Type"
+        description_key = f"{label} Description"
+        imaging_method_key = f"{label} Imaging Method"
+        imaging_accession_key = f"{label} Imaging Method Term Accession"
+        keys = (
+            sample_type_key,
+            description_key,
+            imaging_method_key,
+            imaging_accession_key,
+        )
+
+        graph_add = graph.add
+        build_lab_protocols = self._build_lab_protocols
+        for idx, block in enumerate(blocks, start=1):
+            fields = first_values_in_block(block, keys)
+            sample_type = fields.get(sample_type_key) or default_sample_type
+            description = fields.get(description_key) or ""
+            biosample_id = f"#{kind}-biosample-{idx}"
+            biosample = {
+                "@id": biosample_id,
+                "@type": "BioSample",
+                "name": sample_type,
+                "description": description,
+            }
+            if taxon_refs:
+                biosample["taxonomicRange"] = taxon_refs
+            graph_add(biosample)
+            biosample_ids.append(biosample_id)
+
+            # Imaging method
+            imaging_method = fields.get(imaging_method_key)
+            imaging_accession = fields.get(imaging_accession_key)
+            if imaging_method or imaging_accession:
+                imaging_id = self._build_term_id_simple(imaging_accession, term_sources)
+                imaging_entity = {
+                    "@id": imaging_id,
+                    "@type": "DefinedTerm",
+                    "name": imaging_method or imaging_accession,
+                }
+                graph_add(imaging_entity)
+                imaging_ids.append(imaging_id)
+
+                # Create an imaging protocol (protocol-0) that links to the FBbi term
+                imaging_protocol_id = f"#{kind}-protocol-{idx}-0"
+                imaging_protocol = {
+                    "@id": imaging_protocol_id,
+                    "@type": "LabProtocol",
+                    "name": imaging_method or imaging_accession,
+                    "measurementTechnique": [{"@id": imaging_id}],
+                }
+                if description:
+                    imaging_protocol["description"] = description
+                graph_add(imaging_protocol)
+                imaging_protocol_ids.append(imaging_protocol_id)
+
+                # Build LabProtocols for this block
+                protocol_ids.extend(
+                    build_lab_protocols(
+                        block, idx, imaging_id, graph, kind, term_sources
+                    )
+                )
+
+    def _build_publication_gide(self, study: RowIndex) -> Optional[dict]:
         """Build a ScholarlyArticle entity for GIDE format."""
-        doi = first_value(study_rows, "Study DOI")
-        title = first_value(study_rows, "Study Publication Title")
+        doi = study.first_value("Study DOI")
+        title = study.first_value("Study Publication Title")
 
         if not doi:
             return None
@@ -502,40 +648,13 @@ class ROCrateEncoder:
         self, accession: str, name: str, term_sources: Dict[str, str]
     ) -> str:
         """Build a taxon ID from NCBITaxon accession."""
-        accession = accession.strip() if accession else ""
-        if accession:
-            # Handle NCBITaxon format
-            match = re.search(
-                r"(?:NCBITaxon[_:]?)(\d+)", accession, flags=re.IGNORECASE
-            )
-            if match:
-                return f"http://purl.obolibrary.org/obo/NCBITaxon_{match.group(1)}"
-            if accession.isdigit():
-                return f"http://purl.obolibrary.org/obo/NCBITaxon_{accession}"
-            if re.match(r"^https?://", accession):
-                return accession
-        # Fallback to fragment ID
-        return f"#taxon-{slugify(name)}"
+        return _taxon_id(accession, name)
 
     def _build_term_id_simple(
         self, accession: Optional[str], term_sources: Dict[str, str]
     ) -> str:
         """Build a term ID from an ontology accession."""
-        if not accession:
-            return "#term"
-        accession = accession.strip()
-        if re.match(r"^https?://", accession):
-            return accession
-        # Try to resolve common ontology prefixes
-        match = re.match(r"^([A-Za-z]+)[_:](\d+)$", accession)
-        if match:
-            # If FBbi, handle differently to preserve casing
-            prefix = match.group(1).upper()
-            if prefix == "FBBI":
-                prefix = "FBbi"
-            number = match.group(2)
-            return f"http://purl.obolibrary.org/obo/{prefix}_{number}"
-        return f"#{accession}"
+        return _term_id_simple(accession)
 
     def _build_lab_protocols(
         self,
@@ -545,34 +664,49 @@ class ROCrateEncoder:
         graph: GraphBuilder,
         prefix: str,
         term_sources: Dict[str, str],
-    ) -> List[dict]:
+    ) -> List[str]:
         """Build LabProtocol entities from protocol fields in a block."""
-        protocol_refs = []
-
-        # Get protocol names and descriptions from multi-valued fields
-        protocol_names = []
-        protocol_descriptions = []
-        protocol_types = []
-        protocol_type_accessions = []
-        protocol_type_source_refs = []
+        protocol_ids = []
+
+        # Get protocol names and descriptions from multi-valued fields.
+        # Row values are stored stripped, so they are used as-is.
+        protocol_names: List[str] = []
+        protocol_descriptions: List[str] = []
+        protocol_types: List[str] = []
+        protocol_type_accessions: List[str] = []
+        protocol_type_source_refs: List[str] = []
         for row in block:
             if row.key == "Protocol Name":
-                protocol_names = [v.strip() for v in row.values if v.strip()]
+                protocol_names = [v for v in row.values if v]
             elif row.key == "Protocol Description":
-                protocol_descriptions = [v.strip() for v in row.values if v.strip()]
+                protocol_descriptions = [v for v in row.values if v]
             elif row.key == "Protocol Type":
-                protocol_types = [v.strip() for v in row.values]
+                protocol_types = row.values
             elif row.key == "Protocol Type Term Accession":
-                protocol_type_accessions = [v.strip() for v in row.values]
+                protocol_type_accessions = row.values
             elif row.key == "Protocol Type Term Source REF":
-                protocol_type_source_refs = [v.strip() for v in row.values]
-
-        # Create LabProtocol entities for each protocol
-        for protocol_counter, name in enumerate(protocol_names, start=1):
-            idx = protocol_counter - 1
-            description = (
-                protocol_descriptions[idx] if idx < len(protocol_descriptions) else ""
-            )
+                protocol_type_source_refs = row.values
+
+        # Create LabProtocol entities for each protocol; shorter fields are
+        # padded with "" so no per-index bounds checks are needed.
+        columns = itertools.islice(
+            itertools.zip_longest(
+                protocol_names,
+                protocol_descriptions,
+                protocol_types,
+                protocol_type_accessions,
+                protocol_type_source_refs,
+                fillvalue="",
+            ),
+            len(protocol_names),
+        )
+        for protocol_counter, (
+            name,
+            description,
+            type_name,
+            accession,
+            source_ref,
+        ) in enumerate(columns, start=1):
             protocol_id = f"#{prefix}-protocol-{block_idx}-{protocol_counter}"
             protocol = {
                 "@id": protocol_id,
@@ -582,28 +716,17 @@ class ROCrateEncoder:
             }
 
             # Use EFO protocol type term as measurementTechnique if available
-            if idx < len(protocol_type_accessions) and protocol_type_accessions[idx]:
-                accession = protocol_type_accessions[idx]
-                source_ref = (
-                    protocol_type_source_refs[idx]
-                    if idx < len(protocol_type_source_refs)
-                    else None
-                )
+            if accession:
                 type_id = self._build_term_id_with_source(
                     accession, source_ref, term_sources
                 )
                 if type_id:
                     # Add DefinedTerm entity for the protocol type
-                    type_name = (
-                        protocol_types[idx]
-                        if idx < len(protocol_types) and protocol_types[idx]
-                        else name
-                    )
                     graph.add(
                         {
                             "@id": type_id,
                             "@type": "DefinedTerm",
-                            "name": type_name,
+                            "name": type_name or name,
                         }
                     )
                     protocol["measurementTechnique"] = [{"@id": type_id}]
@@ -611,74 +734,43 @@ class ROCrateEncoder:
             # No fallback - leave measurementTechnique empty if no EFO term found
 
             graph.add(protocol)
-            protocol_refs.append({"@id": protocol_id})
+            protocol_ids.append(protocol_id)
 
-        return protocol_refs
+        return protocol_ids
 
     def _build_term_id_with_source(
         self, accession: str, source_ref: Optional[str], term_sources: Dict[str, str]
     ) -> Optional[str]:
         """Build a term ID from an ontology accession and source reference."""
-        if not accession:
-            return None
-        accession = accession.strip()
-        if re.match(r"^https?://", accession):
-            return accession
-
-        # Try to use the source reference to determine the base URI
-        if source_ref:
-            source_ref_lower = source_ref.lower()
-            if source_ref_lower in term_sources:
-                base = term_sources[source_ref_lower]
-                # Handle cases like "EFO_0003789" -> use as-is
-                return f"{base}{accession}"
-            # Check DEFAULT_TERM_BASES
-            if source_ref_lower in DEFAULT_TERM_BASES:
-                base = DEFAULT_TERM_BASES[source_ref_lower]
-                return f"{base}{accession}"
-
-        # Fallback: try to resolve common ontology prefixes from accession
-        match = re.match(r"^([A-Za-z]+)[_:](\d+)$", accession)
-        if match:
-            prefix = match.group(1).lower()
-            number = match.group(2)
-            if prefix in DEFAULT_TERM_BASES:
-                base = DEFAULT_TERM_BASES[prefix]
-                return f"{base}{prefix.upper()}_{number}"
-            # Default OBO format
-            return f"http://purl.obolibrary.org/obo/{match.group(1).upper()}_{number}"
-
-        return None
+        # Resolve the declared source base here so the cached helper is keyed
+        # on plain strings rather than the whole term source map.
+        source_base = term_sources.get(source_ref.lower()) if source_ref else None
+        return _term_id_with_source(accession, source_ref, source_base)
 
     def _build_dataset_size(
         self,
         screen_blocks: List[List[IDRRow]],
         experiment_blocks: List[List[IDRRow]],
         graph: GraphBuilder,
-    ) -> List[dict]:
+    ) -> List[str]:
         """Build QuantitativeValue entities for dataset size."""
-        size_refs = []
+        size_ids = []
 
         # Look for Screen Size or Experiment Size fields
         tb_parts = []
         images_parts = []
 
-        for block in screen_blocks + experiment_blocks:
+        for block in itertools.chain(screen_blocks, experiment_blocks):
             for row in block:
                 # Parse "Screen Size" or "Experiment Size" fields
                 if row.key in ("Screen Size", "Experiment Size"):
                     for val in row.values:
-                        val = val.strip()
                         # Parse "Total Tb: 10.06" format
-                        tb_match = re.search(
-                            r"Total\s+Tb:\s*([0-9.]+)", val, re.IGNORECASE
-                        )
+                        tb_match = _TB_RE.search(val)
                         if tb_match:
                             tb_parts.append(float(tb_match.group(1)))
                         # Parse "5D Images: 109728" format
-                        images_match = re.search(
-                            r"5D\s+Images:\s*(\d+)", val, re.IGNORECASE
-                        )
+                        images_match = _IMG_RE.search(val)
                         if images_match:
                             images_parts.append(int(images_match.group(1)))
 
@@ -705,7 +797,7 @@ class ROCrateEncoder:
                     "description": desc,
                 }
             )
-            size_refs.append({"@id": size_id})
+            size_ids.append(size_id)
 
         if total_images > 0:
             count_id = "#file-count"
@@ -725,15 +817,21 @@ class ROCrateEncoder:
                     "description": desc,
                 }
             )
-            size_refs.append({"@id": count_id})
+            size_ids.append(count_id)
 
-        return size_refs
+        return size_ids
 
     def _extract_thumbnail_urls(self, value: str) -> List[str]:
         """Extract embeddable thumbnail URLs from a string value."""
         urls = []
-        for match in re.finditer(r"(?:https?://|www\.)[^\s]+", value.strip()):
-            candidate = match.group(0).rstrip(".,;:)]}>'\"")
+        for token in value.split():
+            if not token.startswith(_URL_PREFIXES):
+                # A URL may still be embedded after a leading "(" or label.
+                starts = [i for i in map(token.find, _URL_PREFIXES) if i > 0]
+                if not starts:
+                    continue
+                token = token[min(starts) :]
+            candidate = token.rstrip(".,;:)]}>'\"")
             thumbnail_url = self._to_thumbnail_url(candidate)
             if thumbnail_url:
                 urls.append(thumbnail_url)
@@ -755,7 +853,7 @@ class ROCrateEncoder:
         return study_to_thumbnail
 
     def _extract_study_accession(self, value: str) -> Optional[str]:
-        match = re.search(r"(idr\d+)", value or "", flags=re.IGNORECASE)
+        match = _IDR_ACCESSION_RE.search(value or "")
         if not match:
             return None
         return match.group(1).lower()
@@ -768,43 +866,39 @@ class ROCrateEncoder:
             return None
 
         path = parsed.path or ""
-        render_match = re.search(r"/webgateway/render_thumbnail/(\d+)/?", path)
+        render_match = _RENDER_THUMBNAIL_RE.search(path)
         if render_match:
             image_id = render_match.group(1)
             return f"https://idr.openmicroscopy.org/webgateway/render_thumbnail/{image_id}/"
 
-        detail_match = re.search(r"/webclient/img_detail/(\d+)/?", path)
+        detail_match = _IMG_DETAIL_RE.search(path)
         if detail_match:
             image_id = detail_match.group(1)
             return f"https://idr.openmicroscopy.org/webgateway/render_thumbnail/{image_id}/"
 
         for show_value in parse_qs(parsed.query).get("show", []):
-            image_match = re.fullmatch(r"image-(\d+)", show_value)
+            image_match = _SHOW_IMAGE_RE.fullmatch(show_value)
             if image_match:
                 image_id = image_match.group(1)
                 return f"https://idr.openmicroscopy.org/webgateway/render_thumbnail/{image_id}/"
 
         return None
 
-    def _dedupe_refs(self, refs: List[dict]) -> List[dict]:
-        """Remove duplicate references by @id."""
-        seen = set()
-        result = []
-        for ref in refs:
-            ref_id = ref.get("@id")
-            if ref_id and ref_id not in seen:
-                seen.add(ref_id)
-                result.append(ref)
-        return result
-
 
 class ROCrateDecoder:
     def __init__(self, encoding: str = "utf-8") -> None:
         self.encoding = encoding
 
     def decode_path(self, path: Path) -> IDRMetadata:
-        raw_json = path.read_text(encoding=self.encoding)
-        crate = json.loads(raw_json)
+        raw_bytes = path.read_bytes()
+        if codecs.lookup(self.encoding).name == "utf-8":
+            # Both JSON parsers accept UTF-8 bytes; only a leading BOM must go.
+            if raw_bytes.startswith(codecs.BOM_UTF8):
+                raw_bytes = raw_bytes[len(codecs.BOM_UTF8) :]
+            raw_json = raw_bytes
+        else:
+            raw_json = raw_bytes.decode(self.encoding)
+        crate = orjson.loads(raw_json) if orjson is not None else json.loads(raw_json)
         return self.decode_data(crate)
 
     def decode_data(self, crate: dict) -> IDRMetadata:
@@ -812,11 +906,12 @@ class ROCrateDecoder:
         if not isinstance(graph, list):
             raise ValueError("RO-Crate @graph must be a list")
 
-        entity_map = {
-            entity.get("@id"): entity
-            for entity in graph
-            if isinstance(entity, dict) and entity.get("@id")
-        }
+        entity_map = {}
+        for entity in graph:
+            if type(entity) is dict:
+                entity_id = entity.get("@id")
+                if entity_id:
+                    entity_map[entity_id] = entity
         root_entity = find_root_entity(entity_map)
 
         rows: List[IDRRow] = []
@@ -835,29 +930,98 @@ class ROCrateDecoder:
                         )
                     )
 
-        raw_text = IDREncoder().encode_rows(rows)
-        return IDRMetadata(raw_text=raw_text, rows=rows)
+        # Leave raw_text empty: IDREncoder serializes the rows on demand, so
+        # callers that only inspect rows skip the join entirely.
+        return IDRMetadata(raw_text="", rows=rows)
 
 
 def rows_to_property_values(
     rows: Iterable[IDRRow], exclude_keys: Optional[set] = None
 ) -> List[dict]:
+    exclude = exclude_keys or ()
     props = []
     for row in rows:
-        if not row.key:
-            continue
-        if exclude_keys and row.key in exclude_keys:
+        key = row.key
+        if not key or key in exclude:
             continue
-        prop = {
-            "@type": "PropertyValue",
-            "name": row.key,
-        }
+        # Build each dict in one literal so it is allocated at its final size.
         if row.values:
-            prop["value"] = row.values
-        props.append(prop)
+            props.append({"@type": "PropertyValue", "name": key, "value": row.values})
+        else:
+            props.append({"@type": "PropertyValue", "name": key})
     return props
 
 
+@functools.lru_cache(maxsize=4096)
+def _taxon_id(accession: str, name: str) -> str:
+    accession = accession.strip() if accession else ""
+    if accession:
+        # Bare digits are the common case and cannot match the NCBITaxon regex.
+        if accession.isdigit():
+            return _NCBITAXON_PREFIX + accession
+        # Handle NCBITaxon format (including NCBITaxon URLs)
+        match = _NCBITAXON_RE.search(accession)
+        if match:
+            return _NCBITAXON_PREFIX + match.group(1)
+        if accession.startswith(_HTTP_PREFIXES):
+            return accession
+    # Fallback to fragment ID
+    return f"#taxon-{slugify(name)}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _term_id_simple(accession: Optional[str]) -> str:
+    if not accession:
+        return "#term"
+    accession = accession.strip()
+    if accession.startswith(_HTTP_PREFIXES):
+        return accession
+    # Try to resolve common ontology prefixes
+    match = _PREFIX_ACC_RE.match(accession)
+    if match:
+        # If FBbi, handle differently to preserve casing
+        prefix = match.group(1).upper()
+        if prefix == "FBBI":
+            prefix = "FBbi"
+        number = match.group(2)
+        return f"http://purl.obolibrary.org/obo/{prefix}_{number}"
+    return f"#{accession}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _term_id_with_source(
+    accession: str, source_ref: Optional[str], source_base: Optional[str]
+) -> Optional[str]:
+    if not accession:
+        return None
+    accession = accession.strip()
+    if accession.startswith(_HTTP_PREFIXES):
+        return accession
+
+    # Try to use the source reference to determine the base URI
+    if source_ref:
+        if source_base is not None:
+            # Handle cases like "EFO_0003789" -> use as-is
+            return f"{source_base}{accession}"
+        # Check DEFAULT_TERM_BASES
+        base = DEFAULT_TERM_BASES.get(source_ref.lower())
+        if base is not None:
+            return f"{base}{accession}"
+
+    # Fallback: try to resolve common ontology prefixes from accession
+    match = _PREFIX_ACC_RE.match(accession)
+    if match:
+        prefix = match.group(1).lower()
+        number = match.group(2)
+        base = DEFAULT_TERM_BASES.get(prefix)
+        if base is not None:
+            return f"{base}{prefix.upper()}_{number}"
+        # Default OBO format
+        return f"http://purl.obolibrary.org/obo/{match.group(1).upper()}_{number}"
+
+    return None
+
+
 def build_term_set_map(term_sources: Dict[str, str]) -> Dict[str, str]:
     term_set_map: Dict[str, str] = {}
     for name, uri in term_sources.items():
@@ -894,8 +1058,10 @@ def build_defined_term(
     term_sources: Dict[str, str],
     term_set_map: Dict[str, str],
     fallback_prefix: str,
+    term_sources_ci: Optional[Dict[str, str]] = None,
+    term_set_map_ci: Optional[Dict[str, str]] = None,
 ) -> Tuple[str, dict]:
-    term_id = build_term_id(accession, source_ref, term_sources)
+    term_id = build_term_id(accession, source_ref, term_sources, term_sources_ci)
     if term_id == "#term":
         label = name or accession or "term"
         term_id = f"#{fallback_prefix}-{slugify(label)}"
@@ -908,26 +1074,50 @@ def build_defined_term(
         term_entity["identifier"] = accession
         term_entity["termCode"] = accession
     if source_ref:
-        source_id = get_term_set_id(term_set_map, source_ref)
+        source_id = get_term_set_id(term_set_map, source_ref, term_set_map_ci)
         if source_id:
             term_entity["inDefinedTermSet"] = {"@id": normalize_url(source_id)}
     return term_id, term_entity
 
 
+def fold_keys(mapping: Dict[str, str]) -> Dict[str, str]:
+    """Build the lowercased sibling of mapping for lookup_case_insensitive().
+
+    Build it once the map is filled. Where keys differ only in case, the
+    first one in insertion order wins, as the case-insensitive scan did.
+    """
+    return {name.lower(): value for name, value in reversed(mapping.items())}
+
+
+def lookup_case_insensitive(
+    mapping: Dict[str, str], key: str, mapping_ci: Optional[Dict[str, str]] = None
+) -> Optional[str]:
+    """Look key up exactly, then case-insensitively in mapping_ci.
+
+    mapping_ci is fold_keys(mapping); callers resolving many keys against
+    the same map should build it once and pass it in.
+    """
+    if key in mapping:
+        return mapping[key]
+    if mapping_ci is None:
+        mapping_ci = fold_keys(mapping)
+    return mapping_ci.get(key.lower())
+
+
 def get_term_set_id(
-    term_set_map: Dict[str, str], source_ref: Optional[str]
+    term_set_map: Dict[str, str],
+    source_ref: Optional[str],
+    term_set_map_ci: Optional[Dict[str, str]] = None,
 ) -> Optional[str]:
     if not source_ref:
         return None
     key = source_ref.strip()
     if not key:
         return None
-    if key in term_set_map:
-        return term_set_map[key]
+    term_set_id = lookup_case_insensitive(term_set_map, key, term_set_map_ci)
+    if term_set_id is not None:
+        return term_set_id
     key_lower = key.lower()
-    for name, term_set_id in term_set_map.items():
-        if name.lower() == key_lower:
-            return term_set_id
     if key_lower in DEFAULT_OLS_SOURCES:
         return f"https://www.ebi.ac.uk/ols/ontologies/{key_lower}"
     return None
@@ -936,23 +1126,25 @@ def get_term_set_id(
 def rows_from_property_values(
     properties: Optional[Iterable], entity_map: Dict[str, dict]
 ) -> List[IDRRow]:
+    # Crates are parsed JSON, so exact type checks are enough here and skip
+    # the subclass walk isinstance() would do for every property.
     rows: List[IDRRow] = []
     for prop in as_list(properties):
         prop_entity = prop
-        if isinstance(prop, dict) and prop.get("@id") and len(prop) == 1:
+        if type(prop) is dict and len(prop) == 1 and prop.get("@id"):
             prop_entity = entity_map.get(prop["@id"], prop)
-        if not isinstance(prop_entity, dict):
+        if type(prop_entity) is not dict:
             continue
         name = prop_entity.get("name")
         if not name:
             continue
         values = prop_entity.get("value", [])
-        if isinstance(values, list):
-            value_list = [str(value) for value in values]
+        if type(values) is list:
+            value_list = [str(value).strip() for value in values]
         elif values is None:
             value_list = []
         else:
-            value_list = [str(values)]
+            value_list = [str(values).strip()]
         rows.append(IDRRow(key=name, values=value_list, line_no=0, section=None))
     return rows
 
@@ -980,31 +1172,45 @@ def find_root_entity(entity_map: Dict[str, dict]) -> Optional[dict]:
 
 
 def resolve_entity(ref, entity_map: Dict[str, dict]) -> Optional[dict]:
-    if isinstance(ref, dict) and "@id" in ref:
+    ref_type = type(ref)
+    if ref_type is dict and "@id" in ref:
         return entity_map.get(ref["@id"])
-    if isinstance(ref, str):
+    if ref_type is str:
         return entity_map.get(ref)
     return None
 
 
 def as_list(value) -> List:
+    if type(value) is list:
+        return value
     if value is None:
         return []
-    if isinstance(value, list):
-        return value
     return [value]
 
 
 def normalize_url(value: str) -> str:
+    # Most values are already clean URLs; return them untouched.
+    if value.startswith(_KNOWN_SCHEME_PREFIXES) and not value[-1].isspace():
+        return value
     value = value.strip()
     if not value:
         return value
-    if re.match(r"^[a-zA-Z][a-zA-Z0-9+.-]*://", value):
+    if value.startswith(_KNOWN_SCHEME_PREFIXES) or _SCHEME_RE.match(value):
         return value
     return f"http://{value}"
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_doi(value: str) -> str:
+    # Already-canonical DOI URLs need none of the rewrites below.
+    if (
+        value.startswith("https://doi.org/")
+        and not value[-1].isspace()
+        and "doi:" not in value
+        and "http://" not in value
+        and "dx.doi.org" not in value
+    ):
+        return value
     value = value.strip()
     if not value:
         return value
@@ -1016,7 +1222,7 @@ def normalize_doi(value: str) -> str:
         return value
     if "doi.org" in value:
         return value.replace("http://", "https://")
-    if re.match(r"^https?://", value):
+    if value.startswith(_HTTP_PREFIXES):
         return value
     return f"https://doi.org/{value}"
 
@@ -1061,42 +1267,57 @@ def extract_metadata_descriptor_id(crate: dict) -> Optional[str]:
 
 
 def get_term_source_uri(
-    term_sources: Dict[str, str], source_ref: Optional[str]
+    term_sources: Dict[str, str],
+    source_ref: Optional[str],
+    term_sources_ci: Optional[Dict[str, str]] = None,
 ) -> Optional[str]:
     if not source_ref:
         return None
     key = source_ref.strip()
     if not key:
         return None
-    if key in term_sources:
-        return term_sources[key]
-    key_lower = key.lower()
-    for name, uri in term_sources.items():
-        if name.lower() == key_lower:
-            return uri
-    if key_lower in DEFAULT_TERM_BASES:
-        return DEFAULT_TERM_BASES[key_lower]
-    return None
+    uri = lookup_case_insensitive(term_sources, key, term_sources_ci)
+    if uri is not None:
+        return uri
+    return DEFAULT_TERM_BASES.get(key.lower())
 
 
 def build_term_id(
     accession: Optional[str],
     source_ref: Optional[str],
     sources: Dict[str, str],
+    sources_ci: Optional[Dict[str, str]] = None,
 ) -> str:
+    # Resolve the source base here so the cached part is keyed on strings.
+    base = get_term_source_uri(sources, source_ref, sources_ci) if source_ref else None
+    return _term_id_from_base(accession, base)
+
+
+@functools.lru_cache(maxsize=4096)
+def _term_id_from_base(accession: Optional[str], base: Optional[str]) -> str:
     if accession:
         accession = accession.strip()
-        if re.match(r"^https?://", accession):
+        if accession.startswith(_HTTP_PREFIXES):
             return accession
-    if source_ref:
-        base = get_term_source_uri(sources, source_ref)
-        if base and accession:
-            return f"{base.rstrip('/')}/{accession}"
+    if base and accession:
+        return f"{base.rstrip('/')}/{accession}"
     if accession:
         return f"#{accession}"
     return "#term"
 
 
+def _utf8_prefix_ok(raw_bytes: bytes, size: int = 4096) -> bool:
+    """Return False if the first ``size`` bytes are definitely not UTF-8."""
+    try:
+        raw_bytes[:size].decode("utf-8")
+    except UnicodeDecodeError as exc:
+        # A multi-byte sequence cut at the prefix boundary is not an error.
+        return exc.reason == "unexpected end of data" and exc.end == min(
+            size, len(raw_bytes)
+        )
+    return True
+
+
 def clean_value(value: str) -> str:
     stripped = value.strip()
     if stripped.startswith("#"):
@@ -1104,52 +1325,65 @@ def clean_value(value: str) -> str:
     return stripped
 
 
+def _split_on_double_space(line: str) -> List[str]:
+    """Split on runs of two or more whitespace characters without regex."""
+    parts: List[str] = []
+    start = 0
+    run_start = -1
+    for idx, char in enumerate(line):
+        if char.isspace():
+            if run_start < 0:
+                run_start = idx
+            continue
+        if run_start >= 0 and idx - run_start >= 2:
+            parts.append(line[start:run_start])
+            start = idx
+        run_start = -1
+    if run_start >= 0 and len(line) - run_start >= 2:
+        parts.append(line[start:run_start])
+        start = len(line)
+    parts.append(line[start:])
+    return parts
+
+
 def trim_trailing_empty(values: List[str]) -> List[str]:
-    trimmed = list(values)
-    while trimmed and not trimmed[-1]:
-        trimmed.pop()
-    return trimmed
+    """Drop trailing empty values; returns ``values`` itself if none are empty."""
+    end = len(values)
+    while end and not values[end - 1]:
+        end -= 1
+    return values if end == len(values) else values[:end]
 
 
+@functools.lru_cache(maxsize=1024)
 def slugify(value: str) -> str:
     value = value.lower()
-    value = re.sub(r"[^a-z0-9]+", "-", value).strip("-")
+    value = _SLUG_RE.sub("-", value).strip("-")
     return value or "term"
 
 
-def parse_people(study_rows: List[IDRRow]) -> List[dict]:
-    last_names = values_for_key(study_rows, "Study Person Last Name")
-    first_names = values_for_key(study_rows, "Study Person First Name")
-    emails = values_for_key(study_rows, "Study Person Email")
-    addresses = values_for_key(study_rows, "Study Person Address")
-    orcids = values_for_key(study_rows, "Study Person ORCID")
-    roles = values_for_key(study_rows, "Study Person Roles")
-
-    max_len = max(
-        len(last_names),
-        len(first_names),
-        len(emails),
-        len(addresses),
-        len(orcids),
-        len(roles),
-        0,
-    )
+def parse_people(study: RowIndex) -> List[dict]:
+    last_names = study.values_for_key("Study Person Last Name")
+    first_names = study.values_for_key("Study Person First Name")
+    emails = study.values_for_key("Study Person Email")
+    addresses = study.values_for_key("Study Person Address")
+    orcids = study.values_for_key("Study Person ORCID")
+    roles = study.values_for_key("Study Person Roles")
+
     people = []
-    for idx in range(max_len):
-        last_name = last_names[idx] if idx < len(last_names) else ""
-        first_name = first_names[idx] if idx < len(first_names) else ""
-        email = emails[idx] if idx < len(emails) else ""
-        address = addresses[idx] if idx < len(addresses) else ""
-        orcid = orcids[idx] if idx < len(orcids) else ""
-
-        if not any([last_name, first_name, email, address, orcid]):
+    for idx, (last_name, first_name, email, address, orcid, _role) in enumerate(
+        itertools.zip_longest(
+            last_names, first_names, emails, addresses, orcids, roles, fillvalue=""
+        ),
+        start=1,
+    ):
+        if not (last_name or first_name or email or address or orcid):
             continue
 
-        person_id = build_orcid_id(orcid) if orcid else f"#person-{idx + 1}"
-        name = (
-            " ".join([part for part in [first_name, last_name] if part]).strip()
-            or person_id
-        )
+        person_id = build_orcid_id(orcid) if orcid else f"#person-{idx}"
+        if first_name and last_name:
+            name = f"{first_name} {last_name}"
+        else:
+            name = first_name or last_name or person_id
         person = {
             "@id": person_id,
             "@type": "Person",
@@ -1167,6 +1401,7 @@ def parse_people(study_rows: List[IDRRow]) -> List[dict]:
     return people
 
 
+@functools.lru_cache(maxsize=4096)
 def build_orcid_id(orcid: str) -> str:
     orcid = orcid.strip()
     if not orcid:
@@ -1222,8 +1457,8 @@ def first_value(rows: List[IDRRow], key: str) -> Optional[str]:
         if row.key != key:
             continue
         for value in row.values:
-            if value.strip():
-                return value.strip()
+            if value:
+                return value
     return None
 
 
@@ -1254,11 +1489,49 @@ def first_value_in_block(block: List[IDRRow], key: str) -> Optional[str]:
         if row.key != key:
             continue
         for value in row.values:
-            if value.strip():
-                return value.strip()
+            if value:
+                return value
     return None
 
 
+def first_values_in_block(block: List[IDRRow], keys: Iterable[str]) -> Dict[str, str]:
+    """Return the first non-empty value for each of keys in a single pass."""
+    wanted = set(keys)
+    found: Dict[str, str] = {}
+    for row in block:
+        key = row.key
+        if key not in wanted or key in found:
+            continue
+        for value in row.values:
+            if value:
+                found[key] = value
+                break
+    return found
+
+
+def dumps_crate(crate: dict, indent: int = 2) -> bytes:
+    """Serialize an RO-Crate dict to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and ``indent`` is 0 (compact) or 2, and
+    the stdlib json module otherwise, including when orjson rejects a value
+    (e.g. integers wider than 64 bits). Note that orjson writes NaN and
+    Infinity as ``null`` where json writes them as bare literals.
+    """
+    if orjson is not None and indent in (0, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(crate, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    if indent:
+        text = json.dumps(crate, indent=indent, ensure_ascii=False)
+    else:
+        text = json.dumps(crate, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Convert between IDR metadata text and RO-Crate 1.2 JSON-LD."
@@ -1280,13 +1553,18 @@ def main() -> None:
         default="utf-8",
         help="Text encoding for the input file (default: utf-8)",
     )
+    parser.add_argument(
+        "--indent",
+        type=int,
+        default=2,
+        help="Indentation for RO-Crate JSON output (default: 2; 0 writes compact JSON)",
+    )
     args = parser.parse_args()
 
     if args.reverse:
         output_path = Path(args.output or "idr-metadata.txt")
         metadata = ROCrateDecoder(encoding=args.encoding).decode_path(Path(args.input))
-        idr_text = IDREncoder().encode(metadata)
-        output_path.write_text(idr_text, encoding=args.encoding)
+        output_path.write_bytes(IDREncoder().encode_bytes(metadata, args.encoding))
         return
 
     decoder = IDRDecoder(encoding=args.encoding)
@@ -1300,9 +1578,9 @@ def main() -> None:
             extract_metadata_descriptor_id(crate) or "ro-crate-metadata.json"
         )
         output_path = Path(descriptor_id)
-    output_path.write_text(
-        json.dumps(crate, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    # Serialize to one bytes buffer and write it with a single call; json.dump
+    # to a file object issues a write per encoded chunk.
+    output_path.write_bytes(dumps_crate(crate, indent=args.indent))
 
 
 if __name__ == "__main__":
@@ -4,8 +4,11 @@
 # dependencies = ["tqdm>=4.60", "rdflib>=6.0"] # rdflib is optional for --ttl-out.
 # ///
 import argparse
+import fnmatch
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -15,7 +18,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from idr_rocrate import IDRDecoder, ROCrateEncoder
+from idr_rocrate import IDRDecoder, ROCrateEncoder, dumps_crate
 
 RO_CRATE_CONTEXT_URL = "https://w3id.org/ro/crate/1.2/context"
 RO_CRATE_CONTEXT_FALLBACK = {
@@ -2923,6 +2926,17 @@ RO_CRATE_CONTEXT_FALLBACK = {
 }
 
 
+MANIFEST_NAME = ".batch-generate-manifest.json"
+WRITE_BUFFER_SIZE = 1 << 20
+# Files besides the study text that determine a generated crate. The
+# thumbnail map is read from the working directory, like ROCrateEncoder does.
+ENCODER_INPUTS = (
+    ROOT / "idr_rocrate.py",
+    ROOT / "gide-search-context.jsonld",
+    Path("idr_study_thumbnails.tsv"),
+)
+
+
 def descriptor_output_name(descriptor_id: str | None) -> str:
     """Normalize metadata descriptor IDs to a filename in the output folder."""
     candidate = (descriptor_id or "ro-crate-metadata.json").strip()
@@ -2965,16 +2979,32 @@ def main() -> None:
         action="store_true",
         help="Print per-crate progress details",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes used to generate crates "
+        "(default: CPU count; 1 runs in-process)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse RO-Crates whose study file and encoder inputs are unchanged "
+        "since the last --incremental run",
+    )
     args = parser.parse_args()
 
     input_dir = Path(args.input_dir)
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    decoder = IDRDecoder()
-    encoder = ROCrateEncoder()
-
-    study_files = sorted(input_dir.rglob("idr*-study.txt"))
+    manifest_path = output_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_path) if args.incremental else {}
+    study_files = cached_study_files(input_dir, manifest.get("scan"))
+    if study_files is None:
+        study_files, scan = scan_study_files(input_dir)
+    else:
+        scan = manifest["scan"]
     if not study_files:
         raise SystemExit(f"No idr*-study.txt files found under {input_dir}")
 
@@ -3000,39 +3030,88 @@ def main() -> None:
     log(f"Found {len(study_files)} study metadata files under {input_dir}")
     log(f"Writing RO-Crates to {output_dir}")
 
+    encoder_stamp = [file_stamp(path) for path in ENCODER_INPUTS]
+    cached_entries = {}
+    if manifest.get("encoder") == encoder_stamp:
+        cached_entries = manifest.get("studies", {})
+    manifest_entries = {}
+
+    study_stamps = {path: file_stamp(path) for path in study_files}
+    cached_crates = {}
+    if args.incremental:
+        for study_path in study_files:
+            entry = cached_entries.get(str(study_path))
+            crate = load_cached_crate(output_dir, entry, study_stamps[study_path])
+            if crate is not None:
+                cached_crates[study_path] = crate
+
+    # Decode, encode and serialize the remaining studies in worker processes;
+    # map() yields results in submission order, so the checks and writes
+    # below still run serially in study order.
+    pending = [path for path in study_files if path not in cached_crates]
+    executor = None
+    if args.jobs > 1 and len(pending) > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=min(args.jobs, len(pending)), initializer=init_worker
+        )
+        results = executor.map(generate_crate, pending)
+    else:
+        if pending:
+            init_worker()
+        results = map(generate_crate, pending)
+
     seen_descriptor_files = {}
     subcrates = []
-    for study_path in progress:
-        metadata = decoder.decode(study_path)
-        crate = encoder.encode(metadata)
-        descriptor_file = descriptor_output_name(extract_metadata_descriptor_id(crate))
-        previous_study = seen_descriptor_files.get(descriptor_file)
-        if previous_study is not None:
-            raise SystemExit(
-                f"Conflicting output filename '{descriptor_file}' for {study_path} and {previous_study}. "
-                "All generated RO-Crates must resolve to unique files in a single output folder."
-            )
-        if not args.no_index_crate and descriptor_file == "ro-crate-metadata.json":
-            raise SystemExit(
-                f"Descriptor filename '{descriptor_file}' from {study_path} conflicts with the index crate. "
-                "Use --no-index-crate or update descriptor IDs to unique filenames."
+    try:
+        for study_path in progress:
+            crate = cached_crates.get(study_path)
+            reused = crate is not None
+            if crate is None:
+                crate, crate_json = next(results)
+            descriptor_file = descriptor_output_name(
+                extract_metadata_descriptor_id(crate)
             )
+            previous_study = seen_descriptor_files.get(descriptor_file)
+            if previous_study is not None:
+                raise SystemExit(
+                    f"Conflicting output filename '{descriptor_file}' for {study_path} and {previous_study}. "
+                    "All generated RO-Crates must resolve to unique files in a single output folder."
+                )
+            if not args.no_index_crate and descriptor_file == "ro-crate-metadata.json":
+                raise SystemExit(
+                    f"Descriptor filename '{descriptor_file}' from {study_path} conflicts with the index crate. "
+                    "Use --no-index-crate or update descriptor IDs to unique filenames."
+                )
 
-        output_path = output_dir / descriptor_file
-        output_path.write_text(
-            json.dumps(crate, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
-        log(f"Wrote {output_path}")
-        seen_descriptor_files[descriptor_file] = study_path
-        subcrates.append((descriptor_file, crate))
+            output_path = output_dir / descriptor_file
+            if reused:
+                log(f"Unchanged {output_path}")
+            else:
+                write_atomic(output_path, crate_json)
+                log(f"Wrote {output_path}")
+            seen_descriptor_files[descriptor_file] = study_path
+            subcrates.append((descriptor_file, crate))
+            manifest_entries[str(study_path)] = {
+                "stamp": study_stamps[study_path],
+                "descriptor_file": descriptor_file,
+            }
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if args.incremental:
+        manifest = {
+            "encoder": encoder_stamp,
+            "scan": scan,
+            "studies": manifest_entries,
+        }
+        write_atomic(manifest_path, json.dumps(manifest).encode("utf-8"))
 
     index_path: Optional[Path] = None
     if not args.no_index_crate:
         index_crate = build_index_crate(subcrates)
         index_path = output_dir / "ro-crate-metadata.json"
-        index_path.write_text(
-            json.dumps(index_crate, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        write_atomic(index_path, dumps_crate(index_crate))
         log(f"Wrote index crate to {index_path}")
 
     if args.ttl_out:
@@ -3041,6 +3120,104 @@ def main() -> None:
         log(f"Wrote merged Turtle to {ttl_path}")
 
 
+_worker_state: dict = {}
+
+
+def init_worker() -> None:
+    """Build the decoder and encoder once per worker process."""
+    _worker_state["decoder"] = IDRDecoder()
+    _worker_state["encoder"] = ROCrateEncoder()
+
+
+def generate_crate(study_path: Path) -> tuple[dict, bytes]:
+    """Decode one study file and return its crate and serialized JSON."""
+    metadata = _worker_state["decoder"].decode(study_path)
+    crate = _worker_state["encoder"].encode(metadata)
+    return crate, dumps_crate(crate)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temporary sibling file, then rename it over path.
+
+    An interrupted run never leaves a truncated crate behind.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def file_stamp(path: Path) -> list[int] | None:
+    """Return [mtime_ns, size] for path, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def scan_study_files(input_dir: Path) -> tuple[list[Path], dict]:
+    """Find idr*-study.txt files and record directory mtimes for reuse."""
+    study_files = []
+    dir_stamps = {}
+    for dirpath, _dirnames, filenames in os.walk(input_dir):
+        dir_stamps[dirpath] = os.stat(dirpath).st_mtime_ns
+        for filename in fnmatch.filter(filenames, "idr*-study.txt"):
+            study_files.append(Path(dirpath, filename))
+    study_files.sort()
+    return study_files, {
+        "input_dir": str(input_dir),
+        "dirs": dir_stamps,
+        "files": [str(path) for path in study_files],
+    }
+
+
+def cached_study_files(input_dir: Path, scan: dict | None) -> list[Path] | None:
+    """Return the recorded study files if no scanned directory has changed.
+
+    Adding or removing an entry changes its parent directory's mtime, so
+    stat-ing the recorded directories is enough to detect a stale list.
+    """
+    if not scan or scan.get("input_dir") != str(input_dir):
+        return None
+    for dirpath, mtime_ns in scan.get("dirs", {}).items():
+        try:
+            if os.stat(dirpath).st_mtime_ns != mtime_ns:
+                return None
+        except OSError:
+            return None
+    return [Path(path) for path in scan.get("files", [])]
+
+
+def load_manifest(manifest_path: Path) -> dict:
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def load_cached_crate(
+    output_dir: Path, entry: dict | None, study_stamp: list[int] | None
+) -> dict | None:
+    """Return the previously written crate if its study file is unchanged."""
+    if not entry or study_stamp is None or entry.get("stamp") != study_stamp:
+        return None
+    crate_path = output_dir / entry.get("descriptor_file", "")
+    try:
+        crate = json.loads(crate_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return crate if isinstance(crate, dict) else None
+
+
+# Shared by every subcrate entry; serialized, never mutated.
+SUBCRATE_CONFORMS_TO = {"@id": "https://w3id.org/ro/crate"}
+
+
 def build_index_crate(subcrates) -> dict:
     graph = []
     graph.append(
@@ -3062,6 +3239,7 @@ def build_index_crate(subcrates) -> dict:
         "hasPart": [],
     }
 
+    has_part = root["hasPart"]
     for idx, (descriptor_file, crate) in enumerate(subcrates, start=1):
         crate_rel = f"./{descriptor_file}"
         dataset_id = f"#subcrate-{idx}"
@@ -3069,7 +3247,7 @@ def build_index_crate(subcrates) -> dict:
         entity = {
             "@id": dataset_id,
             "@type": "Dataset",
-            "conformsTo": {"@id": "https://w3id.org/ro/crate"},
+            "conformsTo": SUBCRATE_CONFORMS_TO,
             "subjectOf": {"@id": crate_rel},
         }
         if root_entry:
@@ -3082,7 +3260,7 @@ def build_index_crate(subcrates) -> dict:
                 entity["description"] = description
             if identifier and identifier.startswith("http"):
                 entity["identifier"] = identifier
-        root["hasPart"].append({"@id": dataset_id})
+        has_part.append({"@id": dataset_id})
         graph.append(entity)
         graph.append(
             {
@@ -3122,39 +3300,42 @@ def write_merged_ttl(
 
     jsonld_context.Context._fetch_context = _fetch_context
     try:
+        # Let rdflib read the crate files just written instead of
+        # re-serializing each in-memory crate with json.dumps.
         if index_path is not None:
             index_data = json.loads(index_path.read_text(encoding="utf-8"))
             index_base = crate_base_iri(index_data, index_path.resolve().as_uri())
-            graph.parse(
-                data=json.dumps(index_data), format="json-ld", publicID=index_base
-            )
+            graph.parse(source=str(index_path), format="json-ld", publicID=index_base)
 
         for descriptor_file, crate in subcrates:
             crate_path = (output_dir / descriptor_file).resolve()
             crate_base = crate_base_iri(crate, crate_path.as_uri())
-            graph.parse(data=json.dumps(crate), format="json-ld", publicID=crate_base)
+            graph.parse(source=str(crate_path), format="json-ld", publicID=crate_base)
     finally:
         jsonld_context.Context._fetch_context = original_fetch
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    graph.serialize(destination=str(output_path), format="turtle")
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        graph.serialize(destination=str(tmp_path), format="turtle")
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def extract_metadata_descriptor(crate: dict) -> dict | None:
     graph = crate.get("@graph", [])
     if not isinstance(graph, list):
         return None
+    # Crates come from ROCrateEncoder or json.loads, so exact type checks
+    # are safe and cheaper than isinstance() in this per-entity scan.
     for entity in graph:
-        if not isinstance(entity, dict):
+        if type(entity) is not dict:
             continue
-        entity_type = entity.get("@type", [])
-        if isinstance(entity_type, str):
-            types = [entity_type]
-        elif isinstance(entity_type, list):
-            types = entity_type
-        else:
-            types = []
-        if "CreativeWork" not in types:
+        entity_type = entity.get("@type")
+        if entity_type != "CreativeWork" and not (
+            type(entity_type) is list and "CreativeWork" in entity_type
+        ):
             continue
         if "about" in entity:
             return entity
@@ -3172,18 +3353,17 @@ def extract_root_entity(crate: dict) -> dict | None:
     graph = crate.get("@graph", [])
     if not isinstance(graph, list):
         return None
-    entity_map = {
-        entity.get("@id"): entity
-        for entity in graph
-        if isinstance(entity, dict) and entity.get("@id")
-    }
     descriptor = extract_metadata_descriptor(crate)
     if not descriptor:
         return None
     about = descriptor.get("about")
     root_id = about.get("@id") if isinstance(about, dict) else about
-    if root_id and root_id in entity_map:
-        return entity_map[root_id]
+    if not root_id:
+        return None
+    # Scan from the end so a repeated @id resolves to its last entity.
+    for entity in reversed(graph):
+        if type(entity) is dict and entity.get("@id") == root_id:
+            return entity
     return None
 
 
@@ -1,27 +1,43 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.8"
-# dependencies = ["playwright>=1.48.0", "beautifulsoup4>=4.12.0"]
+# dependencies = ["playwright>=1.48.0", "beautifulsoup4>=4.12.0", "lxml>=5.0.0"]
 # ///
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
-import time
 
 IDR_URL = "https://idr.openmicroscopy.org/"
 
+# Only the DOM is scraped, so these assets are never needed.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
 
 def main() -> None:
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context()
+        context.route(
+            "**/*",
+            lambda route: (
+                route.abort()
+                if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+                else route.continue_()
+            ),
+        )
+        page = context.new_page()
         page.goto(IDR_URL)
-        time.sleep(5)  # Wait for the page to load and render thumbnails.
+        # Wait until the thumbnails have been rendered rather than a fixed delay.
+        page.wait_for_selector(
+            ".studyThumb .viewer_link", state="attached", timeout=30_000
+        )
         html = page.content()
         browser.close()
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     study_thumbs = [
-        el for el in soup.select(".studyThumb") if el.select_one(".studyThumbLink")
+        el
+        for el in soup.find_all(class_="studyThumb")
+        if el.find(class_="studyThumbLink")
     ]
     if not study_thumbs:
         raise SystemExit("No populated .studyThumb elements found.")
@@ -32,7 +48,7 @@ def main() -> None:
     for study_thumb in study_thumbs:
         # Get the Image id from idr from the viewer_link object
         # e.g. <a class="viewer_link" href="/webclient/img_detail/15199994/" target="_blank">
-        image_id = study_thumb.select_one(".viewer_link").get("href", "").split("/")[-2]
+        image_id = study_thumb.find(class_="viewer_link").get("href", "").split("/")[-2]
 
         thumbnail_url = (
             f"https://idr.openmicroscopy.org/webgateway/render_thumbnail/{image_id}/"
@@ -44,10 +60,13 @@ def main() -> None:
         data.append((image_id, project_id, thumbnail_url))
 
     # Save the data to a TSV file
+    lines = ["image_id\tproject_id\tthumbnail_url"]
+    lines.extend(
+        f"{image_id}\t{project_id}\t{thumbnail_url}"
+        for image_id, project_id, thumbnail_url in data
+    )
     with open("idr_study_thumbnails.tsv", "w") as f:
-        f.write("image_id\tproject_id\tthumbnail_url\n")
-        for image_id, project_id, thumbnail_url in data:
-            f.write(f"{image_id}\t{project_id}\t{thumbnail_url}\n")
+        f.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import mmap
 import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -27,112 +28,145 @@ XML_NS = "http://www.w3.org/XML/1998/namespace"
 
 NS = {"rdf": RDF_NS, "rdfs": RDFS_NS, "owl": OWL_NS}
 
-FBBI_USE_RE = re.compile(r"\bobo:(?:FBbi|FBBI)_(\d+)\b")
-NCBI_USE_RE = re.compile(r"\bobo:NCBITaxon_(\d+)\b")
+# Clark-notation names used when walking fbbi.owl.
+OWL_CLASS = f"{{{OWL_NS}}}Class"
+RDF_ABOUT = f"{{{RDF_NS}}}about"
+RDF_RESOURCE = f"{{{RDF_NS}}}resource"
+RDFS_LABEL = f"{{{RDFS_NS}}}label"
+RDFS_SUBCLASS = f"{{{RDFS_NS}}}subClassOf"
+XML_LANG = f"{{{XML_NS}}}lang"
+
+# Bytes patterns: seeds are scanned over a memory map of the raw TTL file.
+SEED_USE_RE = re.compile(rb"\bobo:(FBbi|FBBI|NCBITaxon)_(\d+)\b")
 NCBI_DEF_RE = re.compile(
-    r"obo:NCBITaxon_(\d+)\s+a\s+dwc:Taxon\s*;\s*dwc:scientificName\s+\"([^\"]+)\"\s*\.",
+    rb"obo:NCBITaxon_(\d+)\s+a\s+dwc:Taxon\s*;\s*dwc:scientificName\s+\"([^\"]+)\"\s*\.",
     re.MULTILINE | re.DOTALL,
 )
 
+FBBI_LOCAL_RE = re.compile(r"(?i)fbbi_(.+)")
+
 
 def ttl_escape(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
 
 
 def output_fbbi_id(local_id: str) -> str:
-    match = re.fullmatch(r"(?i)fbbi_(.+)", local_id)
+    # Already in output form: normalising would return the same string.
+    if local_id.startswith("FBbi_"):
+        return local_id
+    match = FBBI_LOCAL_RE.fullmatch(local_id)
     if match:
         return f"FBbi_{match.group(1)}"
     return local_id
 
 
 def read_seeds_from_idr_ttl() -> tuple[set[str], set[str], dict[str, str]]:
-    text = IDR_STUDIES_TTL.read_text(encoding="utf-8")
-    fbbi_seeds = {f"FBbi_{digits}" for digits in FBBI_USE_RE.findall(text)}
-    ncbi_seeds = {digits for digits in NCBI_USE_RE.findall(text)}
-
+    fbbi_seeds: set[str] = set()
+    ncbi_seeds: set[str] = set()
     ncbi_names: dict[str, str] = {}
-    for digits, name in NCBI_DEF_RE.findall(text):
-        ncbi_names[digits] = name
+
+    with IDR_STUDIES_TTL.open("rb") as fh:
+        if not IDR_STUDIES_TTL.stat().st_size:
+            return fbbi_seeds, ncbi_seeds, ncbi_names
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as text:
+            # One scan finds every FBbi/NCBITaxon use; the taxon definition
+            # pattern is only tried where an NCBITaxon id was already found.
+            for match in SEED_USE_RE.finditer(text):
+                prefix, digits = match.groups()
+                if prefix == b"NCBITaxon":
+                    taxon_id = digits.decode("ascii")
+                    ncbi_seeds.add(taxon_id)
+                    definition = NCBI_DEF_RE.match(text, match.start())
+                    if definition:
+                        ncbi_names[taxon_id] = definition.group(2).decode("utf-8")
+                else:
+                    fbbi_seeds.add(f"FBbi_{digits.decode('ascii')}")
     return fbbi_seeds, ncbi_seeds, ncbi_names
 
 
 def parse_fbbi_ontology() -> tuple[dict[str, str], dict[str, set[str]]]:
-    tree = ET.parse(FBBI_OWL)
-    root = tree.getroot()
-
     labels: dict[str, str] = {}
     parents: dict[str, set[str]] = {}
 
-    for class_elem in root.findall(".//owl:Class", NS):
-        about = class_elem.attrib.get(f"{{{RDF_NS}}}about", "")
-        if not about.startswith(OBO_BASE):
+    # Stream the OWL file and drop each top-level element once it has been
+    # handled, so memory stays bounded by one class rather than the whole DOM.
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(FBBI_OWL, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
             continue
-        child = about[len(OBO_BASE) :]
-
-        label = ""
-        for lbl in class_elem.findall("rdfs:label", NS):
-            if not lbl.text:
-                continue
-            text = lbl.text.strip()
-            if not text:
-                continue
-            lang = lbl.attrib.get(f"{{{XML_NS}}}lang", "")
-            if lang.lower() == "en":
-                label = text
-                break
-            if not label and not lang:
-                label = text
-            if not label:
-                label = text
-        labels[child] = label
-
-        child_parents: set[str] = set()
-        for sub in class_elem.findall("rdfs:subClassOf", NS):
-            parent_uri = sub.attrib.get(f"{{{RDF_NS}}}resource", "")
-            if parent_uri.startswith(OBO_BASE):
-                child_parents.add(parent_uri[len(OBO_BASE) :])
-        parents[child] = child_parents
+        depth -= 1
+        if elem.tag == OWL_CLASS:
+            about = elem.attrib.get(RDF_ABOUT, "")
+            if about.startswith(OBO_BASE):
+                child = about[len(OBO_BASE) :]
+
+                # The first English label wins; otherwise the first non-empty one.
+                label = ""
+                has_english = False
+                child_parents: set[str] = set()
+                for sub in elem:
+                    if sub.tag == RDFS_SUBCLASS:
+                        parent_uri = sub.attrib.get(RDF_RESOURCE, "")
+                        if parent_uri.startswith(OBO_BASE):
+                            child_parents.add(parent_uri[len(OBO_BASE) :])
+                    elif sub.tag == RDFS_LABEL and not has_english and sub.text:
+                        text = sub.text.strip()
+                        if not text:
+                            continue
+                        if sub.attrib.get(XML_LANG, "").lower() == "en":
+                            label = text
+                            has_english = True
+                        elif not label:
+                            label = text
+                labels[child] = label
+                parents[child] = child_parents
+        if depth == 1:
+            root.clear()
 
     return labels, parents
 
 
 def fbbi_closure(seed_ids: set[str], parents: dict[str, set[str]]) -> set[str]:
+    # Breadth-first: each level is merged with C-level set operations and
+    # only terms not yet selected are expanded again.
     selected: set[str] = set()
-    stack = [sid for sid in seed_ids if sid in parents]
+    frontier = {sid for sid in seed_ids if sid in parents}
 
-    while stack:
-        current = stack.pop()
-        if current in selected:
-            continue
-        selected.add(current)
-        for parent in parents.get(current, set()):
-            if parent in parents and parent not in selected:
-                stack.append(parent)
+    while frontier:
+        selected |= frontier
+        reached = set().union(*(parents[term] for term in frontier))
+        frontier = {term for term in reached - selected if term in parents}
     return selected
 
 
 def write_fbbi_subset_ttl(
     selected: set[str], labels: dict[str, str], parents: dict[str, set[str]]
 ) -> None:
+    out = [
+        "@prefix obo: <http://purl.obolibrary.org/obo/> .\n",
+        "@prefix owl: <http://www.w3.org/2002/07/owl#> .\n",
+        "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n\n",
+    ]
+    for child in sorted(selected, key=output_fbbi_id):
+        triples = [f"obo:{output_fbbi_id(child)} a owl:Class"]
+        label = labels.get(child, "")
+        if label:
+            triples.append(f'rdfs:label "{ttl_escape(label)}"')
+
+        sel_parents = sorted(p for p in parents.get(child, set()) if p in selected)
+        if sel_parents:
+            parent_list = ", ".join(f"obo:{output_fbbi_id(p)}" for p in sel_parents)
+            triples.append(f"rdfs:subClassOf {parent_list}")
+
+        out.append(" ;\n    ".join(triples) + " .\n\n")
+
+    # Assemble the subset in memory and write it with one call.
     OUT_DIR.mkdir(parents=True, exist_ok=True)
-    with OUT_FBBI_TTL.open("w", encoding="utf-8") as f:
-        f.write("@prefix obo: <http://purl.obolibrary.org/obo/> .\n")
-        f.write("@prefix owl: <http://www.w3.org/2002/07/owl#> .\n")
-        f.write("@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n\n")
-
-        for child in sorted(selected, key=output_fbbi_id):
-            triples = [f"obo:{output_fbbi_id(child)} a owl:Class"]
-            label = labels.get(child, "")
-            if label:
-                triples.append(f'rdfs:label "{ttl_escape(label)}"')
-
-            sel_parents = sorted(p for p in parents.get(child, set()) if p in selected)
-            if sel_parents:
-                parent_list = ", ".join(f"obo:{output_fbbi_id(p)}" for p in sel_parents)
-                triples.append(f"rdfs:subClassOf {parent_list}")
-
-            f.write(" ;\n    ".join(triples) + " .\n\n")
+    OUT_FBBI_TTL.write_text("".join(out), encoding="utf-8")
 
 
 def clean_tsv_field(value: str) -> str:
@@ -148,36 +182,36 @@ def parse_ncbi_selected(
     selected = set(seed_ids)
     names = dict(base_names)
 
-    # First pass: collect all ancestors for IDR taxa.
+    # Read and clean the TSV once; both passes below run over these rows.
     with NCBITAXON_TSV.open("r", encoding="utf-8", newline="") as f:
         reader = csv.reader(f, delimiter="\t")
         next(reader)
-        for row in reader:
-            a_id = clean_tsv_field(row[1])
-            b_id = clean_tsv_field(row[3])
-            a_name = clean_tsv_field(row[4])
-            b_name = clean_tsv_field(row[5])
-            if a_id in seed_ids:
-                selected.add(b_id)
-                names.setdefault(a_id, a_name)
-                names.setdefault(b_id, b_name)
+        rows = [
+            (
+                clean_tsv_field(row[1]),
+                clean_tsv_field(row[3]),
+                clean_tsv_field(row[4]),
+                clean_tsv_field(row[5]),
+            )
+            for row in reader
+        ]
+
+    # First pass: collect all ancestors for IDR taxa.
+    for a_id, b_id, a_name, b_name in rows:
+        if a_id in seed_ids:
+            selected.add(b_id)
+            names.setdefault(a_id, a_name)
+            names.setdefault(b_id, b_name)
 
     # Second pass: build ancestor relations only among selected terms.
     ancestors: dict[str, set[str]] = {}
-    with NCBITAXON_TSV.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f, delimiter="\t")
-        next(reader)
-        for row in reader:
-            a_id = clean_tsv_field(row[1])
-            b_id = clean_tsv_field(row[3])
-            a_name = clean_tsv_field(row[4])
-            b_name = clean_tsv_field(row[5])
-            if a_id in selected:
-                names.setdefault(a_id, a_name)
-            if b_id in selected:
-                names.setdefault(b_id, b_name)
-            if a_id in selected and b_id in selected and a_id != b_id:
-                ancestors.setdefault(a_id, set()).add(b_id)
+    for a_id, b_id, a_name, b_name in rows:
+        if a_id in selected:
+            names.setdefault(a_id, a_name)
+        if b_id in selected:
+            names.setdefault(b_id, b_name)
+        if a_id in selected and b_id in selected and a_id != b_id:
+            ancestors.setdefault(a_id, set()).add(b_id)
 
     return selected, names, ancestors
 
@@ -185,17 +219,16 @@ def parse_ncbi_selected(
 def direct_ncbi_parents(
     selected: set[str], ancestors: dict[str, set[str]]
 ) -> dict[str, set[str]]:
+    # A parent is direct unless it is also an ancestor of another candidate.
+    # ancestors never maps a term to itself, so subtracting the union of the
+    # candidates' ancestor sets is the whole transitive reduction.
     direct: dict[str, set[str]] = {}
+    empty: set[str] = set()
     for child in selected:
-        candidates = set(ancestors.get(child, set()))
+        candidates = ancestors.get(child, empty)
         keep = set(candidates)
-        for parent in candidates:
-            for intermediate in candidates:
-                if intermediate == parent:
-                    continue
-                if parent in ancestors.get(intermediate, set()):
-                    keep.discard(parent)
-                    break
+        for intermediate in candidates:
+            keep.difference_update(ancestors.get(intermediate, empty))
         direct[child] = keep
     return direct
 
@@ -203,24 +236,26 @@ def direct_ncbi_parents(
 def write_ncbi_subset_ttl(
     selected: set[str], names: dict[str, str], direct_parents: dict[str, set[str]]
 ) -> None:
+    out = [
+        "@prefix obo: <http://purl.obolibrary.org/obo/> .\n",
+        "@prefix dwc: <http://rs.tdwg.org/dwc/terms/> .\n",
+        "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n\n",
+    ]
+    for taxon_id in sorted(selected, key=int):
+        triples = [f"obo:NCBITaxon_{taxon_id} a dwc:Taxon"]
+        label = names.get(taxon_id, "")
+        if label:
+            escaped = ttl_escape(label)
+            triples.append(f'rdfs:label "{escaped}"')
+            triples.append(f'dwc:scientificName "{escaped}"')
+        parents = sorted(direct_parents.get(taxon_id, set()), key=int)
+        if parents:
+            parent_list = ", ".join(f"obo:NCBITaxon_{parent}" for parent in parents)
+            triples.append(f"rdfs:subClassOf {parent_list}")
+        out.append(" ;\n    ".join(triples) + " .\n\n")
+
     OUT_DIR.mkdir(parents=True, exist_ok=True)
-    with OUT_NCBI_TTL.open("w", encoding="utf-8") as f:
-        f.write("@prefix obo: <http://purl.obolibrary.org/obo/> .\n")
-        f.write("@prefix dwc: <http://rs.tdwg.org/dwc/terms/> .\n")
-        f.write("@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n\n")
-
-        for taxon_id in sorted(selected, key=int):
-            triples = [f"obo:NCBITaxon_{taxon_id} a dwc:Taxon"]
-            label = names.get(taxon_id, "")
-            if label:
-                escaped = ttl_escape(label)
-                triples.append(f'rdfs:label "{escaped}"')
-                triples.append(f'dwc:scientificName "{escaped}"')
-            parents = sorted(direct_parents.get(taxon_id, set()), key=int)
-            if parents:
-                parent_list = ", ".join(f"obo:NCBITaxon_{parent}" for parent in parents)
-                triples.append(f"rdfs:subClassOf {parent_list}")
-            f.write(" ;\n    ".join(triples) + " .\n\n")
+    OUT_NCBI_TTL.write_text("".join(out), encoding="utf-8")
 
 
 def write_joint_export_ttl() -> None:
@@ -229,6 +264,7 @@ def write_joint_export_ttl() -> None:
     ncbi_text = OUT_NCBI_TTL.read_text(encoding="utf-8").rstrip()
 
     # Keep each source block intact for traceability while producing one merged export.
+    # The export is assembled in memory and written with a single write_text call.
     merged = (
         f"{idr_text}\n\n"
         "# ---- Extracted FBbi hierarchy subset ----\n"
@@ -8,12 +8,17 @@ profile requirements.
 
 Usage:
     python validate_gide_rocrate.py <path_to_rocrate.json>
+    python validate_gide_rocrate.py --jobs 4 <rocrate1.json> <rocrate2.json> ...
     python validate_gide_rocrate.py --help
 """
 
 import json
+import os
+import re
 import sys
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass, field
@@ -25,8 +30,41 @@ except ImportError:
     print("Error: jsonschema package is required. Install with: pip install jsonschema")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib json module is the fallback
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # optional accelerator for the common case of a valid crate
+    fastjsonschema = None
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available, else the stdlib parser."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+ROCRATE_CONTEXT_MARKER = "w3id.org/ro/crate"
+ROCRATE_VERSION_RE = re.compile(r"/(\d+\.\d+)/")
+URL_PREFIXES = ("http://", "https://")
+ORCID_PREFIX = "https://orcid.org/"
 
-@dataclass
+
+def _parse_version(version: str) -> tuple[int, ...]:
+    """Split a dotted version into ints so that e.g. 1.10 sorts after 1.2."""
+    return tuple(int(part) for part in version.split("."))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_schema_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a schema file; mtime_ns is part of the key so edits are picked up."""
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Container for validation results."""
 
@@ -46,11 +84,10 @@ class ValidationResult:
         self.info.append(message)
 
     def merge(self, other: "ValidationResult") -> None:
-        if not other.valid:
-            self.valid = False
-        self.errors.extend(other.errors)
-        self.warnings.extend(other.warnings)
-        self.info.extend(other.info)
+        self.valid = self.valid and other.valid
+        self.errors += other.errors
+        self.warnings += other.warnings
+        self.info += other.info
 
 
 class GIDEProfileValidator:
@@ -60,6 +97,7 @@ class GIDEProfileValidator:
 
     # Required RO-Crate version for detached crates
     MIN_ROCRATE_VERSION = "1.2"
+    _MIN_ROCRATE_VERSION_PARTS = _parse_version(MIN_ROCRATE_VERSION)
 
     # Expected types for various entities
     REQUIRED_TYPES = {
@@ -79,23 +117,45 @@ class GIDEProfileValidator:
     def __init__(self, schema_path: Path | None = None):
         self.schema_path = schema_path or self.SCHEMA_PATH
         self.schema = self._load_schema()
+        # Built once and reused by every validate()/validate_dict() call.
+        self._validator = Draft7Validator(self.schema)
+        self._fast_validate = self._compile_fast_validator()
 
     def _load_schema(self) -> dict:
         """Load the JSON schema."""
         try:
-            with open(self.schema_path) as f:
-                return json.load(f)
+            schema_path = Path(self.schema_path)
+            return _load_schema_cached(
+                str(schema_path.resolve()), schema_path.stat().st_mtime_ns
+            )
         except FileNotFoundError:
             raise FileNotFoundError(f"Schema file not found: {self.schema_path}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in schema file: {e}")
 
-    def validate(self, rocrate_path: str | Path) -> ValidationResult:
+    def _compile_fast_validator(self):
+        """Compile the schema with fastjsonschema, if it is installed."""
+        if fastjsonschema is None:
+            return None
+        try:
+            # Match Draft7Validator: no format assertions, no default filling.
+            return fastjsonschema.compile(
+                self.schema, use_formats=False, use_default=False
+            )
+        except (fastjsonschema.JsonSchemaDefinitionException, TypeError):
+            # Older releases reject use_formats/use_default with TypeError;
+            # jsonschema then handles every crate.
+            return None
+
+    def validate(
+        self, rocrate_path: str | Path, check_schema: bool = True
+    ) -> ValidationResult:
         """
         Validate an RO-Crate file against the GIDE profile.
 
         Args:
             rocrate_path: Path to the RO-Crate metadata descriptor file
+            check_schema: Run the JSON Schema pass before the profile checks
 
         Returns:
             ValidationResult with errors, warnings, and info messages
@@ -104,8 +164,8 @@ class GIDEProfileValidator:
 
         # Load the RO-Crate
         try:
-            with open(rocrate_path) as f:
-                data = json.load(f)
+            with open(rocrate_path, "rb") as f:
+                data = _json_loads(f.read())
         except FileNotFoundError:
             result.add_error(f"File not found: {rocrate_path}")
             return result
@@ -114,36 +174,103 @@ class GIDEProfileValidator:
             return result
 
         # Run all validations
-        result.merge(self._validate_schema(data))
-        result.merge(self._validate_context(data))
-        result.merge(self._validate_structure(data))
-        result.merge(self._validate_semantic_requirements(data))
-
-        return result
+        return self.validate_dict(data, check_schema=check_schema)
 
-    def validate_dict(self, data: dict) -> ValidationResult:
+    def validate_dict(self, data: dict, check_schema: bool = True) -> ValidationResult:
         """
         Validate an RO-Crate dictionary against the GIDE profile.
 
         Args:
             data: Dictionary containing the RO-Crate data
+            check_schema: Run the JSON Schema pass before the profile checks
 
         Returns:
             ValidationResult with errors, warnings, and info messages
         """
         result = ValidationResult()
-        result.merge(self._validate_schema(data))
+        if check_schema:
+            result.merge(self._validate_schema(data))
         result.merge(self._validate_context(data))
-        result.merge(self._validate_structure(data))
-        result.merge(self._validate_semantic_requirements(data))
+
+        # Index the graph once for the structural and semantic checks.
+        entities, by_type, metadata_descriptor, root_dataset = self._prepare(data)
+        result.merge(
+            self._validate_structure(data, entities, metadata_descriptor, root_dataset)
+        )
+        result.merge(
+            self._validate_semantic_requirements(entities, by_type, root_dataset)
+        )
         return result
 
+    def _prepare(
+        self, data: dict
+    ) -> tuple[dict, dict[str, dict], dict | None, dict | None]:
+        """
+        Index @graph and resolve the metadata descriptor and root dataset.
+
+        Returns:
+            (entities by @id, entities by @type then @id, metadata descriptor,
+            root dataset)
+        """
+        graph = data.get("@graph", [])
+        entities = {entity.get("@id"): entity for entity in graph if "@id" in entity}
+
+        by_type: dict[str, dict] = {}
+        for entity_id, entity in entities.items():
+            if not isinstance(entity, dict):
+                continue
+            entity_type = entity.get("@type")
+            if isinstance(entity_type, str):
+                entity_type = (entity_type,)
+            elif not isinstance(entity_type, list):
+                continue
+            for type_name in entity_type:
+                if isinstance(type_name, str):
+                    by_type.setdefault(type_name, {})[entity_id] = entity
+
+        metadata_descriptor = self._find_metadata_descriptor(by_type)
+        root_dataset = None
+        if metadata_descriptor:
+            about = metadata_descriptor.get("about")
+            root_id = about.get("@id") if isinstance(about, dict) else about
+            root_dataset = entities.get(root_id)
+
+        return entities, by_type, metadata_descriptor, root_dataset
+
+    def is_valid(self, data: dict) -> bool:
+        """
+        Return whether an RO-Crate dictionary passes validation.
+
+        A crate that fails the JSON Schema is rejected at the first schema
+        error, without collecting the jsonschema error list. Otherwise the
+        profile checks run exactly as in validate_dict(), messages included.
+        """
+        if not self._schema_is_valid(data):
+            return False
+        return self.validate_dict(data, check_schema=False).valid
+
+    def _schema_is_valid(self, data: dict) -> bool:
+        """Return whether data matches the JSON Schema, stopping at the first error."""
+        if self._fast_validate is None:
+            return self._validator.is_valid(data)
+        try:
+            self._fast_validate(data)
+        except fastjsonschema.JsonSchemaValueException:
+            return False
+        return True
+
     def _validate_schema(self, data: dict) -> ValidationResult:
         """Validate against the JSON Schema."""
         result = ValidationResult()
 
-        validator = Draft7Validator(self.schema)
-        errors = list(validator.iter_errors(data))
+        # The generated validator stops at the first error, so it only decides
+        # the pass case; failures are re-run through jsonschema for the full
+        # error list.
+        if self._fast_validate is not None and self._schema_is_valid(data):
+            result.add_info("JSON Schema validation passed")
+            return result
+
+        errors = list(self._validator.iter_errors(data))
 
         for error in errors:
             path = (
@@ -174,12 +301,10 @@ class GIDEProfileValidator:
         contexts = context if isinstance(context, list) else [context]
 
         for ctx in contexts:
-            if isinstance(ctx, str) and "w3id.org/ro/crate" in ctx:
+            if isinstance(ctx, str) and ROCRATE_CONTEXT_MARKER in ctx:
                 rocrate_context_found = True
                 # Extract version number
-                import re
-
-                match = re.search(r"/(\d+\.\d+)/", ctx)
+                match = ROCRATE_VERSION_RE.search(ctx)
                 if match:
                     rocrate_version = match.group(1)
                 break
@@ -190,7 +315,7 @@ class GIDEProfileValidator:
             )
         elif rocrate_version:
             try:
-                if float(rocrate_version) < float(self.MIN_ROCRATE_VERSION):
+                if _parse_version(rocrate_version) < self._MIN_ROCRATE_VERSION_PARTS:
                     result.add_error(
                         f"RO-Crate version must be >= {self.MIN_ROCRATE_VERSION} for detached crates (found {rocrate_version})"
                     )
@@ -203,20 +328,20 @@ class GIDEProfileValidator:
 
         return result
 
-    def _validate_structure(self, data: dict) -> ValidationResult:
+    def _validate_structure(
+        self,
+        data: dict,
+        entities: dict,
+        metadata_descriptor: dict | None,
+        root_dataset: dict | None,
+    ) -> ValidationResult:
         """Validate the required graph structure."""
         result = ValidationResult()
 
-        graph = data.get("@graph", [])
-        if not graph:
+        if not data.get("@graph", []):
             result.add_error("@graph is missing or empty")
             return result
 
-        # Build entity index
-        entities = {entity.get("@id"): entity for entity in graph if "@id" in entity}
-
-        # Find metadata descriptor
-        metadata_descriptor = self._find_metadata_descriptor(entities)
         if not metadata_descriptor:
             result.add_error(
                 "Missing RO-Crate Metadata Descriptor (CreativeWork with 'about')"
@@ -244,8 +369,6 @@ class GIDEProfileValidator:
             result.add_error("Root dataset @id is missing or empty")
             return result
 
-        root_dataset = entities.get(root_id)
-
         if not root_dataset:
             result.add_error(f"Root dataset with @id '{root_id}' not found in graph")
             return result
@@ -254,7 +377,7 @@ class GIDEProfileValidator:
             result.add_error("Root dataset must have @type 'Dataset'")
 
         # Check root dataset @id is absolute URL
-        if not str(root_id).startswith(("http://", "https://")):
+        if not (isinstance(root_id, str) and root_id.startswith(URL_PREFIXES)):
             result.add_error(
                 f"Root dataset @id must be an absolute URL (found: {root_id})"
             )
@@ -263,46 +386,33 @@ class GIDEProfileValidator:
 
         return result
 
-    def _validate_semantic_requirements(self, data: dict) -> ValidationResult:
+    def _validate_semantic_requirements(
+        self, entities: dict, by_type: dict[str, dict], root_dataset: dict | None
+    ) -> ValidationResult:
         """Validate semantic requirements from the profile."""
         result = ValidationResult()
 
-        graph = data.get("@graph", [])
-        entities = {entity.get("@id"): entity for entity in graph if "@id" in entity}
-
-        # Get root dataset
-        metadata_descriptor = self._find_metadata_descriptor(entities)
-        if not metadata_descriptor:
-            return result  # Already reported in structure validation
-
-        about = metadata_descriptor.get("about")
-        root_id = about.get("@id") if isinstance(about, dict) else about
-        root_dataset = entities.get(root_id)
-
         if not root_dataset:
-            return result  # Already reported
+            return result  # Already reported in structure validation
 
         # Validate required entities
-        result.merge(self._validate_taxons(root_dataset, entities))
-        result.merge(self._validate_imaging_methods(root_dataset, entities))
-        result.merge(self._validate_authors(root_dataset, entities))
-        result.merge(self._validate_publisher(root_dataset, entities))
-        result.merge(self._validate_quantitative_values(root_dataset, entities))
+        result.merge(self._validate_taxons(root_dataset, by_type))
+        result.merge(self._validate_imaging_methods(root_dataset, by_type))
+        result.merge(self._validate_authors(root_dataset, by_type))
+        result.merge(self._validate_publisher(root_dataset, entities, by_type))
+        result.merge(self._validate_quantitative_values(root_dataset, by_type))
 
         return result
 
-    def _validate_taxons(self, dataset: dict, entities: dict) -> ValidationResult:
+    def _validate_taxons(self, dataset: dict, by_type: dict) -> ValidationResult:
         """Validate that at least one Taxon is present in 'about'."""
         result = ValidationResult()
 
-        about = dataset.get("about", [])
-        about_list = about if isinstance(about, list) else [about]
-
+        taxons = by_type.get("Taxon", {})
         taxon_found = False
-        for ref in about_list:
-            ref_id = ref.get("@id") if isinstance(ref, dict) else ref
-            entity = entities.get(ref_id)
-            if entity and self._has_type(entity, "Taxon"):
+        for ref_id in self._iter_ids(dataset.get("about")):
+            entity = taxons.get(ref_id)
+            if entity:
                 taxon_found = True
                 # Check required fields
                 if "scientificName" not in entity:
@@ -319,19 +429,15 @@ class GIDEProfileValidator:
         return result
 
     def _validate_imaging_methods(
-        self, dataset: dict, entities: dict
+        self, dataset: dict, by_type: dict
     ) -> ValidationResult:
         """Validate that at least one imaging method (DefinedTerm) is in 'measurementMethod'."""
         result = ValidationResult()
 
-        methods = dataset.get("measurementMethod", [])
-        methods_list = methods if isinstance(methods, list) else [methods]
-
+        defined_terms = by_type.get("DefinedTerm", {})
         defined_term_found = False
-        for ref in methods_list:
-            ref_id = ref.get("@id") if isinstance(ref, dict) else ref
-            entity = entities.get(ref_id)
-            if entity and self._has_type(entity, "DefinedTerm"):
+        for ref_id in self._iter_ids(dataset.get("measurementMethod")):
+            if ref_id in defined_terms:
                 defined_term_found = True
                 break
 
@@ -344,33 +450,28 @@ class GIDEProfileValidator:
 
         return result
 
-    def _validate_authors(self, dataset: dict, entities: dict) -> ValidationResult:
+    def _validate_authors(self, dataset: dict, by_type: dict) -> ValidationResult:
         """Validate that at least one author (Person) is present."""
         result = ValidationResult()
 
         authors = dataset.get("author", [])
-        authors_list = authors if isinstance(authors, list) else [authors]
-
-        if not authors_list:
+        if isinstance(authors, list) and not authors:
             result.add_error("Dataset must have at least one author")
             return result
 
+        # Organizations as authors are allowed; only Persons are checked.
+        persons = by_type.get("Person", {})
         person_found = False
-        for ref in authors_list:
-            ref_id = ref.get("@id") if isinstance(ref, dict) else ref
+        for ref_id in self._iter_ids(authors):
             if not ref_id:
                 continue
-            entity = entities.get(ref_id)
-            if entity:
-                if self._has_type(entity, "Person"):
-                    person_found = True
-                    # Check for ORCID recommendation
-                    if not str(ref_id).startswith("https://orcid.org/"):
-                        result.add_warning(
-                            f"Author '{ref_id}' should preferably use an ORCID identifier"
-                        )
-                elif self._has_type(entity, ["Organization", "Organisation"]):
-                    pass  # Organizations as authors are allowed
+            if ref_id in persons:
+                person_found = True
+                # Check for ORCID recommendation
+                if not (isinstance(ref_id, str) and ref_id.startswith(ORCID_PREFIX)):
+                    result.add_warning(
+                        f"Author '{ref_id}' should preferably use an ORCID identifier"
+                    )
 
         if not person_found:
             result.add_warning("Dataset should have at least one Person as author")
@@ -379,7 +480,9 @@ class GIDEProfileValidator:
 
         return result
 
-    def _validate_publisher(self, dataset: dict, entities: dict) -> ValidationResult:
+    def _validate_publisher(
+        self, dataset: dict, entities: dict, by_type: dict
+    ) -> ValidationResult:
         """Validate that exactly one publisher (Organisation) is present."""
         result = ValidationResult()
 
@@ -391,9 +494,14 @@ class GIDEProfileValidator:
         pub_id = publisher.get("@id") if isinstance(publisher, dict) else publisher
         pub_entity = entities.get(pub_id)
 
+        is_organisation = any(
+            pub_id in by_type.get(type_name, {})
+            for type_name in ("Organization", "Organisation")
+        )
+
         if not pub_entity:
             result.add_error(f"Publisher entity '{pub_id}' not found in graph")
-        elif not self._has_type(pub_entity, ["Organization", "Organisation"]):
+        elif not is_organisation:
             result.add_error(
                 f"Publisher '{pub_id}' must be of type Organization/Organisation"
             )
@@ -403,22 +511,22 @@ class GIDEProfileValidator:
         return result
 
     def _validate_quantitative_values(
-        self, dataset: dict, entities: dict
+        self, dataset: dict, by_type: dict
     ) -> ValidationResult:
         """Validate QuantitativeValue entities if present."""
         result = ValidationResult()
 
-        size = dataset.get("size", [])
-        size_list = size if isinstance(size, list) else [size] if size else []
+        size = dataset.get("size")
+        size_ids = self._iter_ids(size) if size else ()
 
         has_file_count = False
         has_bytes = False
 
-        for ref in size_list:
-            ref_id = ref.get("@id") if isinstance(ref, dict) else ref
-            entity = entities.get(ref_id)
+        quantitative_values = by_type.get("QuantitativeValue", {})
+        for ref_id in size_ids:
+            entity = quantitative_values.get(ref_id)
 
-            if entity and self._has_type(entity, "QuantitativeValue"):
+            if entity:
                 unit_code = entity.get("unitCode", "")
                 unit_text = entity.get("unitText", "")
 
@@ -436,7 +544,7 @@ class GIDEProfileValidator:
                             f"Bytes QuantitativeValue should use unitText 'bytes'"
                         )
 
-        if size_list:
+        if size:
             if not has_file_count:
                 result.add_warning(
                     "Recommended: Include QuantitativeValue for file count (unitCode: UO_0000189)"
@@ -454,22 +562,23 @@ class GIDEProfileValidator:
 
     def _has_type(self, entity: dict, type_name: str | list[str]) -> bool:
         """Check if an entity has a specific @type."""
-        entity_type = entity.get("@type", [])
+        entity_type = entity.get("@type")
+        if entity_type is None:
+            return False
 
+        # Compare strings directly instead of wrapping them in lists.
         if isinstance(entity_type, str):
-            entity_type = [entity_type]
+            if isinstance(type_name, str):
+                return entity_type == type_name
+            return entity_type in type_name
 
         if isinstance(type_name, str):
-            type_name = [type_name]
-
+            return type_name in entity_type
         return any(t in entity_type for t in type_name)
 
-    def _find_metadata_descriptor(self, entities: dict) -> dict | None:
-        for entity in entities.values():
-            if not isinstance(entity, dict):
-                continue
-            if not self._has_type(entity, "CreativeWork"):
-                continue
+    def _find_metadata_descriptor(self, by_type: dict) -> dict | None:
+        # Only CreativeWork entities can be the descriptor; by_type keeps graph order.
+        for entity in by_type.get("CreativeWork", {}).values():
             if "about" in entity:
                 return entity
         return None
@@ -482,6 +591,69 @@ class GIDEProfileValidator:
             return ref
         return None
 
+    @staticmethod
+    def _iter_ids(value: Any):
+        """Yield the @id of each reference in a single value or a list of them."""
+        if value is None:
+            return
+        if isinstance(value, list):
+            for ref in value:
+                yield ref.get("@id") if isinstance(ref, dict) else ref
+        elif isinstance(value, dict):
+            yield value.get("@id")
+        else:
+            yield value
+
+
+_worker_state: dict = {}
+
+
+def init_worker(schema_path: Path | None) -> None:
+    """Build the validator once per worker process."""
+    _worker_state["validator"] = GIDEProfileValidator(schema_path=schema_path)
+
+
+def validate_file(rocrate_path: str, check_schema: bool = True) -> ValidationResult:
+    """Validate one file with this process's validator."""
+    return _worker_state["validator"].validate(rocrate_path, check_schema=check_schema)
+
+
+def result_to_dict(result: ValidationResult) -> dict:
+    return {
+        "valid": result.valid,
+        "errors": result.errors,
+        "warnings": result.warnings,
+        "info": result.info,
+    }
+
+
+def format_report(result: ValidationResult, quiet: bool) -> list[str]:
+    """Render a result as text lines for the terminal or a pipe."""
+    # Emoji markers only on a terminal; piped output stays plain ASCII.
+    if sys.stdout.isatty():
+        error_mark, warning_mark, info_mark, pass_mark = "❌ ", "⚠️  ", "ℹ️  ", "✅ "
+        bullet = "•"
+    else:
+        error_mark = warning_mark = info_mark = pass_mark = ""
+        bullet = "-"
+
+    lines = []
+    sections = [(f"{error_mark}ERRORS:", result.errors)]
+    if not quiet:
+        sections.append((f"{warning_mark}WARNINGS:", result.warnings))
+        sections.append((f"{info_mark}INFO:", result.info))
+    for heading, messages in sections:
+        if messages:
+            lines.append(heading)
+            lines.extend(f"  {bullet} {message}" for message in messages)
+            lines.append("")
+
+    if result.valid:
+        lines.append(f"{pass_mark}Validation PASSED")
+    else:
+        lines.append(f"{error_mark}Validation FAILED")
+    return lines
+
 
 def main():
     """Command-line interface for the validator."""
@@ -493,11 +665,13 @@ Examples:
   %(prog)s ro-crate-metadata.json
   %(prog)s examples/idr0002-ro-crate-metadata.json
   %(prog)s --schema custom-schema.json rocrate.json
+  %(prog)s --jobs 4 ro-crates/*-ro-crate-metadata.json
         """,
     )
     parser.add_argument(
         "rocrate_file",
-        help="Path to the RO-Crate metadata descriptor file to validate",
+        nargs="+",
+        help="Path(s) to the RO-Crate metadata descriptor file(s) to validate",
     )
     parser.add_argument(
         "--schema", help="Path to custom JSON schema file (optional)", type=Path
@@ -511,50 +685,67 @@ Examples:
     parser.add_argument(
         "--json", "-j", action="store_true", help="Output results as JSON"
     )
+    parser.add_argument(
+        "--no-schema",
+        action="store_true",
+        help="Skip JSON Schema validation and run only the RO-Crate profile checks",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes used when validating several files "
+        "(default: CPU count; 1 runs in-process)",
+    )
 
     args = parser.parse_args()
+    files = args.rocrate_file
+    validate_one = functools.partial(validate_file, check_schema=not args.no_schema)
 
     try:
-        validator = GIDEProfileValidator(schema_path=args.schema)
-        result = validator.validate(args.rocrate_file)
+        # Built in this process first so schema problems are reported directly.
+        init_worker(args.schema)
+        if args.jobs > 1 and len(files) > 1:
+            jobs = min(args.jobs, len(files))
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=init_worker, initargs=(args.schema,)
+            ) as executor:
+                results = list(
+                    executor.map(
+                        validate_one, files, chunksize=max(1, len(files) // (4 * jobs))
+                    )
+                )
+        else:
+            results = [validate_one(path) for path in files]
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(2)
 
     if args.json:
-        output = {
-            "valid": result.valid,
-            "errors": result.errors,
-            "warnings": result.warnings,
-            "info": result.info,
-        }
-        print(json.dumps(output, indent=2))
-    else:
-        # Print results
-        if result.errors:
-            print("❌ ERRORS:")
-            for error in result.errors:
-                print(f"  • {error}")
-            print()
-
-        if result.warnings and not args.quiet:
-            print("⚠️  WARNINGS:")
-            for warning in result.warnings:
-                print(f"  • {warning}")
-            print()
-
-        if result.info and not args.quiet:
-            print("ℹ️  INFO:")
-            for info in result.info:
-                print(f"  • {info}")
-            print()
-
-        if result.valid:
-            print("✅ Validation PASSED")
+        if len(files) == 1:
+            output = result_to_dict(results[0])
         else:
-            print("❌ Validation FAILED")
-
-    sys.exit(0 if result.valid else 1)
+            output = [
+                {"file": path, **result_to_dict(result)}
+                for path, result in zip(files, results)
+            ]
+        if orjson is not None:
+            text = orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
+        else:
+            text = json.dumps(output, indent=2, ensure_ascii=False)
+        sys.stdout.write(text + "\n")
+    elif len(files) == 1:
+        # Collect the report and write it in one call.
+        sys.stdout.write("\n".join(format_report(results[0], args.quiet)) + "\n")
+    else:
+        lines = []
+        for path, result in zip(files, results):
+            lines.append(f"== {path} ==")
+            lines.extend(format_report(result, args.quiet))
+            lines.append("")
+        sys.stdout.write("\n".join(lines))
+
+    sys.exit(0 if all(result.valid for result in results) else 1)
 
 
 if __name__ == "__main__":